@@ -1,5 +1,6 @@
 """FastAPI dependencies."""
 
+from functools import lru_cache
 from typing import Generator
 from uuid import UUID
 
@@ -11,8 +12,12 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
-# Database manager instance
-db_manager = DatabaseManager(settings.database_url)
+
+@lru_cache(maxsize=1)
+def get_db_manager() -> DatabaseManager:
+    """Get the shared database manager, creating the engine on first use."""
+    return DatabaseManager(settings.database_url)
+
 
 # Security scheme
 security = HTTPBearer()
@@ -20,7 +25,7 @@ security = HTTPBearer()
 
 def get_db() -> Generator[Session, None, None]:
     """Get database session."""
-    yield from db_manager.get_session()
+    yield from get_db_manager().get_session()
 
 
 def get_current_user_id(
@@ -17,7 +17,7 @@ router = APIRouter(prefix="/chat", tags=["chat"])
 @router.post(
     "/message", response_model=ConversationResponse, status_code=status.HTTP_200_OK
 )
-def send_message(
+async def send_message(
     request: ConversationRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -43,7 +43,7 @@ def send_message(
         Conversation response with appropriate action taken
     """
     service = ConversationService(db)
-    return service.handle_message(current_user.user_id, request)
+    return await service.handle_message(current_user.user_id, request)
 
 
 @router.post("/stream")
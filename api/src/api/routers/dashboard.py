@@ -1,11 +1,14 @@
 """Dashboard summary endpoints."""
 
+from functools import lru_cache
 from typing import Any, Dict, List
 from uuid import UUID
 
 from core.services.budget import BudgetService
 from core.services.decision import DecisionService
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from pydantic_core import to_json
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_current_user_id, get_db
@@ -13,6 +16,12 @@ from api.dependencies import get_current_user_id, get_db
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
+@lru_cache(maxsize=1024)
+def _category_label(name: str) -> str:
+    """Display label for a budget category key, e.g. "eating_out" -> "Eating Out"."""
+    return name.replace("_", " ").title()
+
+
 @router.get("")
 def get_dashboard_data(
     user_id: UUID = Depends(get_current_user_id),
@@ -59,7 +68,7 @@ def get_dashboard_data(
 
             allocation_health.append(
                 {
-                    "label": name.replace("_", " ").title(),
+                    "label": _category_label(name),
                     "utilized": spent,
                     "limit": limit,
                     "percentage": round(percent, 1),
@@ -67,10 +76,14 @@ def get_dashboard_data(
                 }
             )
 
-    return {
+    dashboard = {
         "guard_score": summary["guard_score"],
         "status": summary["score_status"],
         "trend": summary["score_trend"],
         "allocation_health": allocation_health,
         "recent_intercepts": summary["recent_decisions"],
     }
+
+    # pydantic-core's encoder writes the same JSON as FastAPI's
+    # jsonable_encoder + json.dumps without walking the dict in Python
+    return Response(content=to_json(dashboard), media_type="application/json")
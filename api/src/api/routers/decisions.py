@@ -2,6 +2,7 @@
 
 import base64
 from datetime import datetime
+from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
@@ -16,6 +17,7 @@ from core.models.decision import (
 from core.observability.pii_redaction import create_trace_attributes
 from core.services.decision import DecisionService
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.responses import Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -53,6 +55,7 @@ def list_decisions(
     offset: int = 0,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -63,6 +66,7 @@ def list_decisions(
         offset: Number of decisions to skip
         start_date: Optional start date for filtering
         end_date: Optional end date for filtering
+        cursor: next_cursor from the previous page, used instead of offset
         db: Database session
         current_user: Authenticated user
 
@@ -70,12 +74,26 @@ def list_decisions(
         Paginated list of purchase decisions
     """
     service = DecisionService(db)
-    return service.list_decisions(
-        current_user.user_id,
-        limit,
-        offset,
-        start_date=start_date,
-        end_date=end_date,
+    try:
+        result = service.list_decisions(
+            current_user.user_id,
+            limit,
+            offset,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    # The service already returns a validated PurchaseDecisionListResponse, so
+    # serialize it directly instead of letting FastAPI re-validate every item
+    # against response_model before encoding.
+    return Response(
+        content=result.model_dump_json(by_alias=True), media_type="application/json"
     )
 
 
@@ -94,7 +112,12 @@ def get_decision_stats(
         Decision statistics
     """
     service = DecisionService(db)
-    return service.get_decision_stats(current_user.user_id)
+
+    # Stats are cached already encoded, so they are served as-is
+    return Response(
+        content=service.get_decision_stats_json(current_user.user_id),
+        media_type="application/json",
+    )
 
 
 @router.get("/{decision_id}", response_model=PurchaseDecisionDB)
@@ -124,7 +147,10 @@ def get_decision(
             status_code=status.HTTP_404_NOT_FOUND, detail="Decision not found"
         )
 
-    return decision
+    # Built from a trusted row; encode directly rather than re-validating
+    return Response(
+        content=decision.model_dump_json(by_alias=True), media_type="application/json"
+    )
 
 
 @router.post("/{decision_id}/feedback", response_model=PurchaseDecisionDB)
@@ -159,7 +185,10 @@ def add_decision_feedback(
             status_code=status.HTTP_404_NOT_FOUND, detail="Decision not found"
         )
 
-    return decision
+    # Built from a trusted row; encode directly rather than re-validating
+    return Response(
+        content=decision.model_dump_json(by_alias=True), media_type="application/json"
+    )
 
 
 @router.post(
@@ -228,8 +257,6 @@ async def extract_cart_screenshot(
 
         # Convert extracted items to CartItem models
         cart_items = []
-        from decimal import Decimal
-
         for item in extraction_result.items:
             cart_item = CartItem(
                 item_name=item.item_name,
@@ -52,6 +52,5 @@ def update_me(
         setattr(user, key, value)
 
     db.commit()
-    db.refresh(user)
 
     return user
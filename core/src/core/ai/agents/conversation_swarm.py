@@ -4,6 +4,7 @@ This module uses a swarm-based architecture where agents hand off control to eac
 replacing the graph-based approach for better error handling and simpler execution flow.
 """
 
+import asyncio
 import logging
 import re
 from typing import List, Optional
@@ -11,9 +12,9 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
 from strands import Agent
-from strands.models.gemini import GeminiModel
 from strands.multiagent import Swarm
 
+from core.ai.agents.gemini import PooledGeminiModel
 from core.ai.tools.budget_tools import create_budget_tools
 from core.ai.tools.decision_tools import create_decision_tools
 from core.ai.tools.feedback_tools import create_feedback_tools
@@ -25,6 +26,83 @@ from core.observability.pii_redaction import create_trace_attributes
 
 logger = logging.getLogger(__name__)
 
+# Patterns and word lists used on every turn to track conversation state
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+_GOAL_NAME_RE = re.compile(r"goal[:\s]+['\"]?([^'\",.!?]+)['\"]?", re.IGNORECASE)
+_NUMERIC_RE = re.compile(r"[\d.]+")
+# Conversation intent recorded for each specialist agent that ends a turn
+_AGENT_INTENTS = {
+    "purchase_decision": "purchase_decision",
+    "purchase_feedback": "purchase_feedback",
+    "budget_query": "budget_query",
+    "goal_update": "goal_update",
+    "log_expense": "log_expense",
+    "budget_modification": "budget_modification",
+    "general_assistant": "general_question",
+    "small_talk": "small_talk",
+}
+# Specialists told never to hand off, so whatever they write is the reply
+_TERMINAL_AGENTS = frozenset({"budget_query", "goal_update", "small_talk"})
+# Agents whose turns update the active budget category
+_BUDGET_AGENTS = frozenset({"budget_query", "log_expense", "budget_modification"})
+# Messages that are nothing but a greeting, thanks or sign-off. The router
+# would answer these itself, so they go straight to the small talk agent
+# without building the swarm. Acknowledgements like "ok" are left out since
+# they may confirm a specialist's pending question.
+_SMALL_TALK_RE = re.compile(
+    r"\s*(hi|hello|hey|thanks|thank you|thx|bye|goodbye"
+    r"|good (morning|afternoon|evening|night))( there| so much)?[\s!.,:)]*",
+    re.IGNORECASE,
+)
+# Common budget-related words to skip when looking for a category name
+_CATEGORY_SKIP_WORDS = frozenset(
+    {
+        "in",
+        "on",
+        "for",
+        "to",
+        "the",
+        "my",
+        "a",
+        "an",
+        "with",
+        "from",
+        "how",
+        "much",
+        "left",
+        "is",
+        "what",
+        "show",
+        "me",
+        "budget",
+        "category",
+        "add",
+        "create",
+        "set",
+        "limit",
+        "update",
+        "change",
+        "log",
+        "spent",
+        "spend",
+        "expense",
+        "and",
+        "i",
+        "please",
+    }
+)
+
+
+def is_small_talk(message: str) -> bool:
+    """Whether a message is only a greeting, thanks or sign-off.
+
+    Such turns are answered by the small talk agent alone, without the
+    swarm or the user's financial context.
+    """
+    return _SMALL_TALK_RE.fullmatch(message) is not None
+
 
 class SwarmOrchestrator:
     """
@@ -56,7 +134,7 @@ class SwarmOrchestrator:
         self.session_id = str(uuid4())
 
         # Shared model configuration for all agents
-        self.model = GeminiModel(
+        self.model = PooledGeminiModel(
             client_args={"api_key": settings.google_api_key},
             model_id=settings.strands_default_model,
             params={
@@ -93,6 +171,45 @@ class SwarmOrchestrator:
         self.small_talk_agent = None
         self.swarm = None
 
+        # Redacted trace attributes per agent action. They only depend on the
+        # user/session, so they are built on first use and reused every turn.
+        self._trace_attributes_cache: dict[str, dict] = {}
+
+        # One orchestrator is shared by all of a user's requests. Callers hold
+        # this for the whole turn so concurrent turns don't swap self.db or
+        # the per-turn agents out from under each other.
+        self.turn_lock = asyncio.Lock()
+
+    def _trace_attributes(self, action: str) -> dict:
+        """Get the (cached) trace attributes for an agent action."""
+        attributes = self._trace_attributes_cache.get(action)
+        if attributes is None:
+            attributes = create_trace_attributes(
+                user_id=self.user_id,
+                session_id=self.session_id,
+                action=action,
+            )
+            self._trace_attributes_cache[action] = attributes
+        return dict(attributes)
+
+    def close(self):
+        """Drop the per-turn agents, swarm and database session.
+
+        Agents and the swarm are rebuilt every turn, so only the conversation
+        state survives; the orchestrator can still run later turns.
+        """
+        self.db = None
+        self.router_agent = None
+        self.purchase_decision_agent = None
+        self.purchase_feedback_agent = None
+        self.budget_query_agent = None
+        self.goal_update_agent = None
+        self.log_expense_agent = None
+        self.budget_modification_agent = None
+        self.general_assistant_agent = None
+        self.small_talk_agent = None
+        self.swarm = None
+
     def _create_router_agent(self, tools=None) -> Agent:
         """Create router agent that decides whether to respond or hand off.
 
@@ -178,11 +295,7 @@ User: "Add groceries category with $500 limit and log $50 purchase"
 - When unsure, hand off to the specialist
 - Include relevant context when handing off"""
 
-        trace_attributes = create_trace_attributes(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            action="route",
-        )
+        trace_attributes = self._trace_attributes("route")
 
         return Agent(
             name="router",
@@ -240,11 +353,7 @@ If the user asks follow-up questions that need other specialists (like "show me
 **Note:** After calling save_purchase_decision(), you don't need to mention the decision_id in your response to the user - the system will track it automatically for future reference (e.g., if they say "I bought that item").
 """
 
-        trace_attributes = create_trace_attributes(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            action="purchase_decision",
-        )
+        trace_attributes = self._trace_attributes("purchase_decision")
 
         # Tools will be injected when processing message
         return Agent(
@@ -311,11 +420,7 @@ If the user wants to see budget impact after logging feedback, you can hand off
 
 **Be empathetic:** If they regretted a purchase, help them learn from it without being judgmental."""
 
-        trace_attributes = create_trace_attributes(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            action="purchase_feedback",
-        )
+        trace_attributes = self._trace_attributes("purchase_feedback")
 
         return Agent(
             name="purchase_feedback",
@@ -348,11 +453,7 @@ If the user wants to see budget impact after logging feedback, you can hand off
 
 **No handoffs needed** - you're a terminal specialist (just answer and finish)."""
 
-        trace_attributes = create_trace_attributes(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            action="budget_query",
-        )
+        trace_attributes = self._trace_attributes("budget_query")
 
         return Agent(
             name="budget_query",
@@ -381,11 +482,7 @@ If the user wants to see budget impact after logging feedback, you can hand off
 
 **No handoffs needed** - you're a terminal specialist (just answer and finish)."""
 
-        trace_attributes = create_trace_attributes(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            action="goal_update",
-        )
+        trace_attributes = self._trace_attributes("goal_update")
 
         return Agent(
             name="goal_update",
@@ -428,11 +525,7 @@ If the user asks to see budget details after logging, you can hand off to:
 - Default to "general" category if user doesn't specify and it exists
 - Be efficient with multi-expense logging - confirm all at once"""
 
-        trace_attributes = create_trace_attributes(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            action="log_expense",
-        )
+        trace_attributes = self._trace_attributes("log_expense")
 
         return Agent(
             name="log_expense",
@@ -481,11 +574,7 @@ User: "Add groceries category with $500 limit and log $50 purchase"
 
 **DO NOT hand off to general_assistant or router. You are the budget modification expert - use your tools!**"""
 
-        trace_attributes = create_trace_attributes(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            action="budget_modification",
-        )
+        trace_attributes = self._trace_attributes("budget_modification")
 
         return Agent(
             name="budget_modification",
@@ -524,11 +613,7 @@ If user asks specific questions about their budget or goals during advice, you c
 
 **DO NOT hand off to budget_modification or router - you're not an intermediary.**"""
 
-        trace_attributes = create_trace_attributes(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            action="general_question",
-        )
+        trace_attributes = self._trace_attributes("general_question")
 
         return Agent(
             name="general_assistant",
@@ -553,11 +638,7 @@ Respond warmly to greetings, thanks, and casual conversation.
 
 **No handoffs needed** - you handle simple conversations and finish."""
 
-        trace_attributes = create_trace_attributes(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            action="small_talk",
-        )
+        trace_attributes = self._trace_attributes("small_talk")
 
         return Agent(
             name="small_talk",
@@ -656,9 +737,12 @@ Respond warmly to greetings, thanks, and casual conversation.
         # Add conversation history (last 10 messages)
         if conversation_history:
             context_parts.append("RECENT CONVERSATION (last 10 messages):")
-            for msg in conversation_history[-10:]:
-                role_label = "User" if msg.role == "user" else "Assistant"
-                context_parts.append(f"  {role_label}: {msg.content}")
+            context_parts.extend(
+                [
+                    f"  {'User' if msg.role == 'user' else 'Assistant'}: {msg.content}"
+                    for msg in conversation_history[-10:]
+                ]
+            )
         else:
             context_parts.append("RECENT CONVERSATION: None (first message)")
 
@@ -749,39 +833,22 @@ Respond warmly to greetings, thanks, and casual conversation.
         logger.info(f"Agent chain: {agent_chain}")
 
         # Infer last_intent from the final specialist agent
-        intent_map = {
-            "purchase_decision": "purchase_decision",
-            "purchase_feedback": "purchase_feedback",
-            "budget_query": "budget_query",
-            "goal_update": "goal_update",
-            "log_expense": "log_expense",
-            "budget_modification": "budget_modification",
-            "general_assistant": "general_question",
-            "small_talk": "small_talk",
-        }
         for agent_name in reversed(agent_chain):
-            if agent_name in intent_map:
-                self.conversation_state["last_intent"] = intent_map[agent_name]
+            intent = _AGENT_INTENTS.get(agent_name)
+            if intent is not None:
+                self.conversation_state["last_intent"] = intent
                 break
 
         # Extract active contexts from response text
         # Use the same extraction method as in process_message
         response_text = self._extract_final_response(result)
 
-        # Track active category from budget-related agents
-        if any(
-            a in agent_chain
-            for a in ("budget_query", "log_expense", "budget_modification")
-        ):
-            # Try to extract category from the user message
-            msg_lower = user_message.lower()
-            # Simple heuristic: if the response mentions a specific category, track it
-            for agent_name in ("budget_modification", "log_expense", "budget_query"):
-                if agent_name in agent_chain:
-                    self.conversation_state["active_category"] = (
-                        self._extract_category_from_message(msg_lower)
-                    )
-                    break
+        # Track active category from budget-related agents, extracted from
+        # the user message
+        if not _BUDGET_AGENTS.isdisjoint(agent_chain):
+            self.conversation_state["active_category"] = (
+                self._extract_category_from_message(user_message.lower())
+            )
 
         # Track active decision from purchase_decision agent
         if "purchase_decision" in agent_chain:
@@ -801,48 +868,12 @@ Respond warmly to greetings, thanks, and casual conversation.
         Simple keyword extraction — returns the first recognized word
         that could be a category name.
         """
-        # Common budget-related prepositions to skip
-        skip_words = {
-            "in",
-            "on",
-            "for",
-            "to",
-            "the",
-            "my",
-            "a",
-            "an",
-            "with",
-            "from",
-            "how",
-            "much",
-            "left",
-            "is",
-            "what",
-            "show",
-            "me",
-            "budget",
-            "category",
-            "add",
-            "create",
-            "set",
-            "limit",
-            "update",
-            "change",
-            "log",
-            "spent",
-            "spend",
-            "expense",
-            "and",
-            "i",
-            "please",
-        }
-        words = message.split()
-        for word in words:
+        for word in message.split():
             cleaned = word.strip("$.,!?\"'()").lower()
             if (
                 cleaned
-                and cleaned not in skip_words
-                and not cleaned.replace(".", "").isdigit()
+                and cleaned not in _CATEGORY_SKIP_WORDS
+                and not _NUMERIC_RE.fullmatch(cleaned)
             ):
                 return cleaned
         return None
@@ -868,8 +899,7 @@ Respond warmly to greetings, thanks, and casual conversation.
                         result_str = str(node_result.result)
                         if "decision_id" in result_str.lower():
                             # Try to extract UUID from the result
-                            uuid_pattern = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
-                            match = re.search(uuid_pattern, result_str, re.IGNORECASE)
+                            match = _UUID_RE.search(result_str)
                             if match:
                                 decision_id = match.group(0)
                                 logger.info(
@@ -878,8 +908,7 @@ Respond warmly to greetings, thanks, and casual conversation.
                                 return decision_id
 
         # Fallback: try to find UUID in response text
-        uuid_pattern = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
-        match = re.search(uuid_pattern, response_text, re.IGNORECASE)
+        match = _UUID_RE.search(response_text)
         if match:
             return match.group(0)
 
@@ -888,22 +917,56 @@ Respond warmly to greetings, thanks, and casual conversation.
 
     def _extract_goal_name(self, response_text: str) -> Optional[str]:
         """Try to extract a goal name from agent response text."""
-        match = re.search(
-            r"goal[:\s]+['\"]?([^'\",.!?]+)['\"]?", response_text, re.IGNORECASE
-        )
+        match = _GOAL_NAME_RE.search(response_text)
         return (
             match.group(1).strip()
             if match
             else self.conversation_state.get("active_goal_name")
         )
 
-    def process_message(
+    def _begin_turn(
+        self,
+        conversation_history: List[ConversationMessage],
+        financial_context: Optional[UserFinancialContext],
+    ):
+        """Record a new turn in the conversation state."""
+        self.conversation_state["turn_count"] += 1
+        self.conversation_state["conversation_history"] = conversation_history
+        self.conversation_state["financial_context"] = financial_context
+
+    def _begin_small_talk_turn(
         self,
         user_message: str,
         conversation_history: List[ConversationMessage],
-        financial_context: Optional[UserFinancialContext] = None,
+        financial_context: Optional[UserFinancialContext],
+    ) -> Optional[Agent]:
+        """Start a turn on the small talk fast path if the message allows it.
+
+        Args:
+            user_message: User's message
+            conversation_history: Recent conversation history
+            financial_context: Pre-fetched financial context
+
+        Returns:
+            A tool-less small talk agent for plain greetings, thanks and
+            sign-offs, or None if the message needs the full swarm
+        """
+        if not is_small_talk(user_message):
+            return None
+
+        self._begin_turn(conversation_history, financial_context)
+        self.conversation_state["last_intent"] = "small_talk"
+        return self._create_small_talk_agent(tools=[])
+
+    def _prepare_turn(
+        self,
+        user_message: str,
+        conversation_history: List[ConversationMessage],
+        financial_context: Optional[UserFinancialContext],
     ) -> str:
-        """Process a user message through the conversation swarm.
+        """Set up state, agents and swarm for a turn and build its task prompt.
+
+        Shared by process_message and stream_message.
 
         Args:
             user_message: User's message
@@ -911,12 +974,9 @@ Respond warmly to greetings, thanks, and casual conversation.
             financial_context: Pre-fetched financial context
 
         Returns:
-            Assistant's response
+            Task prompt for the swarm
         """
-        # Update conversation state
-        self.conversation_state["turn_count"] += 1
-        self.conversation_state["conversation_history"] = conversation_history
-        self.conversation_state["financial_context"] = financial_context
+        self._begin_turn(conversation_history, financial_context)
 
         # Recreate agents and swarm each turn with fresh financial context
         self._create_agents_with_tools(financial_context)
@@ -927,14 +987,45 @@ Respond warmly to greetings, thanks, and casual conversation.
             conversation_history, financial_context
         )
 
-        # Build task prompt
-        task = f"""User message: {user_message}
+        return f"""User message: {user_message}
 
 CONTEXT:
 {context_str}
 
 Analyze this message and either respond directly (for simple greetings/thanks) OR hand off to the appropriate specialist agent."""
 
+    def process_message(
+        self,
+        user_message: str,
+        conversation_history: List[ConversationMessage],
+        financial_context: Optional[UserFinancialContext] = None,
+    ) -> str:
+        """Process a user message through the conversation swarm.
+
+        Args:
+            user_message: User's message
+            conversation_history: Recent conversation history
+            financial_context: Pre-fetched financial context
+
+        Returns:
+            Assistant's response
+        """
+        small_talk_agent = self._begin_small_talk_turn(
+            user_message, conversation_history, financial_context
+        )
+        if small_talk_agent is not None:
+            try:
+                response_text = str(small_talk_agent(user_message)).strip()
+            except Exception as e:
+                logger.error(f"Small talk reply failed: {e}", exc_info=True)
+                return "I encountered an error while processing your request. Please try again."
+            return (
+                response_text
+                or "I'm sorry, I couldn't generate a response. Please try again or rephrase your question."
+            )
+
+        task = self._prepare_turn(user_message, conversation_history, financial_context)
+
         try:
             # Execute swarm
             result = self.swarm(task)
@@ -1027,32 +1118,28 @@ Analyze this message and either respond directly (for simple greetings/thanks) O
         Yields:
             Response chunks
         """
-        # Update conversation state
-        self.conversation_state["turn_count"] += 1
-        self.conversation_state["conversation_history"] = conversation_history
-        self.conversation_state["financial_context"] = financial_context
-
-        # Recreate agents and swarm each turn with fresh financial context
-        self._create_agents_with_tools(financial_context)
-        self._initialize_swarm()
-
-        # Build context for router
-        context_str = self._build_context_for_router(
-            conversation_history, financial_context
+        small_talk_agent = self._begin_small_talk_turn(
+            user_message, conversation_history, financial_context
         )
+        if small_talk_agent is not None:
+            try:
+                async for event in small_talk_agent.stream_async(user_message):
+                    if "data" in event:
+                        yield {"data": event["data"]}
+            except Exception as e:
+                logger.error(f"Small talk streaming failed: {e}", exc_info=True)
+                yield {
+                    "data": "I encountered an error while processing your request. Please try again."
+                }
+            return
 
-        # Build task prompt
-        task = f"""User message: {user_message}
-
-CONTEXT:
-{context_str}
-
-Analyze this message and either respond directly (for simple greetings/thanks) OR hand off to the appropriate specialist agent."""
+        task = self._prepare_turn(user_message, conversation_history, financial_context)
 
         last_active_agent = None
         # Buffer text per agent so we only yield from the final agent.
         # Intermediate agents produce handoff narration that shouldn't
-        # be shown to the user.
+        # be shown to the user. Terminal agents never hand off, so their
+        # text is final and streams through as it arrives.
         current_agent = None
         agent_buffer = []
         try:
@@ -1070,9 +1157,12 @@ Analyze this message and either respond directly (for simple greetings/thanks) O
                 elif event_type == "multiagent_node_stream":
                     inner_event = event.get("event", {})
                     if "data" in inner_event:
-                        # Buffer text — don't yield yet, we don't know
-                        # if this agent is the final one
-                        agent_buffer.append(inner_event["data"])
+                        if current_agent in _TERMINAL_AGENTS:
+                            yield {"data": inner_event["data"]}
+                        else:
+                            # Buffer text — don't yield yet, we don't know
+                            # if this agent is the final one
+                            agent_buffer.append(inner_event["data"])
 
                 elif event_type == "multiagent_handoff":
                     from_agents = event.get("from_node_ids", [])
@@ -1100,25 +1190,12 @@ Analyze this message and either respond directly (for simple greetings/thanks) O
 
         # Update last_intent from the last active agent in the stream
         if last_active_agent:
-            intent_map = {
-                "purchase_decision": "purchase_decision",
-                "purchase_feedback": "purchase_feedback",
-                "budget_query": "budget_query",
-                "goal_update": "goal_update",
-                "log_expense": "log_expense",
-                "budget_modification": "budget_modification",
-                "general_assistant": "general_question",
-                "small_talk": "small_talk",
-            }
-            if last_active_agent in intent_map:
-                self.conversation_state["last_intent"] = intent_map[last_active_agent]
+            intent = _AGENT_INTENTS.get(last_active_agent)
+            if intent is not None:
+                self.conversation_state["last_intent"] = intent
 
             # Track active category for budget-related agents
-            if last_active_agent in (
-                "budget_query",
-                "log_expense",
-                "budget_modification",
-            ):
+            if last_active_agent in _BUDGET_AGENTS:
                 self.conversation_state["active_category"] = (
                     self._extract_category_from_message(user_message.lower())
                 )
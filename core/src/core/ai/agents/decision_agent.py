@@ -1,5 +1,6 @@
 """AI-powered purchase decision agent using Strands."""
 
+import json
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
@@ -8,21 +9,26 @@ from uuid import UUID, uuid4
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from strands import Agent
-from strands.models.gemini import GeminiModel
 
+from core.ai.agents.gemini import PooledGeminiModel
 from core.ai.tools.decision_tools import create_decision_tools
 from core.config import settings
 from core.database.models import User
 from core.models.context import UserFinancialContext
 from core.models.decision import (
+    BUDGET_CATEGORIES,
+    DECISION_SCORES,
+    PURCHASE_CATEGORIES,
     BudgetAnalysis,
     BudgetCategory,
     DecisionAnalysis,
     DecisionScore,
     GoalAnalysis,
+    OpportunityCost,
     PurchaseCategory,
     PurchaseDecision,
     PurchaseDecisionRequest,
+    decision_category_for_score,
 )
 from core.observability.pii_redaction import create_trace_attributes
 
@@ -104,9 +110,12 @@ class DecisionAgent:
         self.db_session = db_session
         self.session_id = session_id
 
+        # (persona, strictness) per user, so batch analysis loads each user once
+        self._user_preferences: dict[UUID, tuple[str, int]] = {}
+
         # Initialize Gemini model
         # Lower temperature for cart analysis - want consistent scoring across batch items
-        model = GeminiModel(
+        model = PooledGeminiModel(
             client_args={
                 "api_key": settings.google_api_key,
             },
@@ -175,11 +184,29 @@ Keep responses SHORT and DATA-DRIVEN. Focus on budget/goal impact and opportunit
 
         return self._default_system_prompt
 
+    def _get_user_preferences(
+        self, user_id: UUID, db_session: Session
+    ) -> tuple[str, int]:
+        """Get the user's (persona, strictness), loading them once per agent."""
+        preferences = self._user_preferences.get(user_id)
+        if preferences is None:
+            user = db_session.query(User).filter(User.user_id == user_id).first()
+            persona = user.persona_tone if user and user.persona_tone else "balanced"
+            strictness = (
+                user.strictness_level
+                if user and user.strictness_level is not None
+                else 5
+            )
+            preferences = (persona, strictness)
+            self._user_preferences[user_id] = preferences
+        return preferences
+
     def analyze_purchase(
         self,
         user_id: UUID,
         request: PurchaseDecisionRequest,
         financial_context: Optional[UserFinancialContext] = None,
+        db_session: Optional[Session] = None,
     ) -> PurchaseDecision:
         """Analyze a purchase decision request.
 
@@ -190,16 +217,17 @@ Keep responses SHORT and DATA-DRIVEN. Focus on budget/goal impact and opportunit
             user_id: The user making the purchase request
             request: Purchase decision request details
             financial_context: Pre-fetched financial context (budget, goals, decisions)
+            db_session: Session for this call's queries, e.g. one per worker
+                thread; defaults to the agent's session
 
         Returns:
             Purchase decision with score and reasoning
         """
+        if db_session is None:
+            db_session = self.db_session
+
         # Fetch user persona and strictness
-        user = self.db_session.query(User).filter(User.user_id == user_id).first()
-        persona = user.persona_tone if user and user.persona_tone else "balanced"
-        strictness = (
-            user.strictness_level if user and user.strictness_level is not None else 5
-        )
+        persona, strictness = self._get_user_preferences(user_id, db_session)
 
         # Generate a unique session ID for this decision
         session_id = str(uuid4())
@@ -242,7 +270,7 @@ Keep responses SHORT and DATA-DRIVEN. Focus on budget/goal impact and opportunit
 
         # Create tools bound to this user
         # This prevents the need to pass user_id in the prompt (PII protection)
-        tools = create_decision_tools(self.db_session, str(user_id), financial_context)
+        tools = create_decision_tools(db_session, str(user_id), financial_context)
 
         # Create agent for this request with trace attributes and structured output
         # OpenTelemetry will automatically trace all interactions
@@ -280,8 +308,6 @@ Provide score, reasoning (2-3 sentences), opportunity cost examples, and brief a
 
         # Extract the JSON output from AgentResult
         # The agent returns JSON as a string in response.output
-        import json
-
         if hasattr(response, "output"):
             json_str = response.output
         else:
@@ -323,31 +349,24 @@ Provide score, reasoning (2-3 sentences), opportunity cost examples, and brief a
         Returns:
             PurchaseDecision domain model
         """
-        # Map score to decision category
-        score = structured.score
-        try:
-            decision_category = DecisionScore(structured.decision_category)
-        except ValueError:
-            # Fallback to score-based mapping if invalid category
-            if score <= 3:
-                decision_category = DecisionScore.STRONG_NO
-            elif score <= 5:
-                decision_category = DecisionScore.MILD_NO
-            elif score == 6:
-                decision_category = DecisionScore.NEUTRAL
-            elif score <= 8:
-                decision_category = DecisionScore.MILD_YES
-            else:
-                decision_category = DecisionScore.STRONG_YES
+        # Map score to decision category, falling back to the score table if
+        # the model returned an unknown category
+        decision_category = (
+            DecisionScore(structured.decision_category)
+            if structured.decision_category in DECISION_SCORES
+            else decision_category_for_score(structured.score)
+        )
 
         # Build budget analysis if available
         budget_analysis = None
         if structured.budget_category and structured.budget_limit is not None:
             # Convert string to BudgetCategory enum
-            try:
-                category_enum = BudgetCategory(structured.budget_category.lower())
-            except ValueError:
-                category_enum = BudgetCategory.GENERAL
+            budget_category = structured.budget_category.lower()
+            category_enum = (
+                BudgetCategory(budget_category)
+                if budget_category in BUDGET_CATEGORIES
+                else BudgetCategory.GENERAL
+            )
 
             budget_analysis = BudgetAnalysis(
                 category=category_enum,
@@ -389,14 +408,13 @@ Provide score, reasoning (2-3 sentences), opportunity cost examples, and brief a
                     affected_goals.append(goal_analysis)
 
         # Parse purchase category
-        try:
-            purchase_category = PurchaseCategory(structured.purchase_category)
-        except ValueError:
-            purchase_category = PurchaseCategory.DISCRETIONARY
+        purchase_category = (
+            PurchaseCategory(structured.purchase_category)
+            if structured.purchase_category in PURCHASE_CATEGORIES
+            else PurchaseCategory.DISCRETIONARY
+        )
 
         # Build opportunity cost analysis
-        from core.models.decision import OpportunityCost
-
         opportunity_cost = OpportunityCost(
             description=structured.opportunity_cost_description,
             examples=structured.opportunity_cost_examples
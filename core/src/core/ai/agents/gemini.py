@@ -0,0 +1,34 @@
+"""Gemini model that shares one genai.Client across requests."""
+
+import threading
+from typing import Any
+
+from google import genai
+from strands.models.gemini import GeminiModel
+
+# (client_args, client) pairs. Only a handful of distinct configurations are
+# ever used, and client args may hold unhashable values (e.g. http_options
+# dicts), so they are matched by equality rather than used as dict keys.
+_clients: list[tuple[dict[str, Any], genai.Client]] = []
+_clients_lock = threading.Lock()
+
+
+class PooledGeminiModel(GeminiModel):
+    """GeminiModel that reuses one genai.Client per set of client args.
+
+    The stock model builds a new client, with its SSL contexts and HTTP
+    clients, for every request. A client can be shared across threads and
+    event loops: genai keeps its async session per event loop and drops the
+    ones whose loop has closed. Strands' sync Agent.__call__ runs every call
+    on a fresh loop, so open connections are only reused by calls made on
+    the same loop; the client itself is reused by all of them.
+    """
+
+    def _get_client(self) -> genai.Client:
+        with _clients_lock:
+            for client_args, client in _clients:
+                if client_args == self.client_args:
+                    return client
+            client = genai.Client(**self.client_args)
+            _clients.append((dict(self.client_args), client))
+            return client
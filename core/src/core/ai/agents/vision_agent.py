@@ -1,11 +1,12 @@
 """AI-powered vision extraction agent for cart screenshots using Strands."""
 
+import json
 from typing import Optional
 
 from pydantic import BaseModel, Field
 from strands import Agent
-from strands.models.gemini import GeminiModel
 
+from core.ai.agents.gemini import PooledGeminiModel
 from core.config import settings
 
 
@@ -54,7 +55,7 @@ class VisionAgent:
     def __init__(self):
         """Initialize vision agent with Gemini Vision model."""
         # Initialize Gemini model with vision capabilities
-        self.model = GeminiModel(
+        self.model = PooledGeminiModel(
             client_args={
                 "api_key": settings.google_api_key,
             },
@@ -163,8 +164,6 @@ Be thorough and accurate. If you're not confident about an item, reflect that in
             return response
 
         # Fallback: parse if it's returned as JSON string
-        import json
-
         if hasattr(response, "output"):
             json_str = response.output
         else:
@@ -0,0 +1,66 @@
+"""Tests for the pooled Gemini model."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from strands import Agent
+
+from core.ai.agents import gemini
+from core.ai.agents.gemini import PooledGeminiModel
+
+
+class _RequestSent(Exception):
+    """Raised by the fake client once the model has picked a client."""
+
+
+@pytest.fixture(autouse=True)
+def clients():
+    """Start with an empty process-wide client cache."""
+    gemini._clients.clear()
+    yield gemini._clients
+    gemini._clients.clear()
+
+
+def _model(**client_args):
+    return PooledGeminiModel(
+        client_args={"api_key": "test-key", **client_args}, model_id="gemini"
+    )
+
+
+def _fake_client(**client_args):
+    client = MagicMock()
+    client.aio.models.generate_content_stream = AsyncMock(side_effect=_RequestSent)
+    return client
+
+
+def test_client_shared_across_models_and_event_loops():
+    """Test every model with the same client args gets one client."""
+
+    async def client():
+        return _model()._get_client()
+
+    assert asyncio.run(client()) is asyncio.run(client())
+    assert _model()._get_client() is not _model(api_key="other")._get_client()
+
+
+def test_client_args_with_dict_values():
+    """Test unhashable client args (e.g. http_options) are supported."""
+    options = {"timeout": 30_000}
+
+    first = _model(http_options=options)._get_client()
+
+    assert _model(http_options=dict(options))._get_client() is first
+
+
+def test_client_shared_across_sync_agent_calls():
+    """Test sync Agent calls, each run on a fresh event loop, share one client."""
+    with patch.object(gemini.genai, "Client", side_effect=_fake_client) as create:
+        for _ in range(3):
+            agent = Agent(model=_model(), callback_handler=None)
+            with pytest.raises(_RequestSent):
+                agent("hi")
+
+    create.assert_called_once()
+    client = gemini._clients[0][1]
+    assert client.aio.models.generate_content_stream.await_count == 3
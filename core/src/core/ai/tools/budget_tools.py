@@ -53,23 +53,24 @@ def create_budget_tools(
 
         days_remaining = (budget.period_end - datetime.utcnow().date()).days
         total_limit = float(budget.total_monthly)
-        total_spent = sum(cat.get("spent", 0) for cat in budget.categories.values())
-        total_remaining = total_limit - total_spent
-        percentage_used = (total_spent / total_limit * 100) if total_limit > 0 else 0
+        # Rolled up from the categories when they were last written
+        total_spent = float(budget.total_spent)
 
         categories = {}
         for name, cat in budget.categories.items():
             cat_limit = float(cat.get("limit", 0))
             cat_spent = float(cat.get("spent", 0))
-            cat_remaining = cat_limit - cat_spent
             cat_pct = (cat_spent / cat_limit * 100) if cat_limit > 0 else 0
             categories[name] = {
                 "spent": cat_spent,
                 "limit": cat_limit,
-                "remaining": cat_remaining,
+                "remaining": cat_limit - cat_spent,
                 "percentage_used": round(cat_pct, 1),
             }
 
+        total_remaining = total_limit - total_spent
+        percentage_used = (total_spent / total_limit * 100) if total_limit > 0 else 0
+
         return {
             "has_budget": True,
             "budget_name": budget.name,
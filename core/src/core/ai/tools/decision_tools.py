@@ -5,7 +5,6 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from strands import tool
 
@@ -13,98 +12,6 @@ from core.database.models import Budget, Goal, PurchaseDecision
 from core.models.context import UserFinancialContext
 
 
-class BudgetCheckInput(BaseModel):
-    """Input schema for budget check tool."""
-
-    category: str = Field(..., description="Budget category to check")
-    amount: float = Field(..., description="Purchase amount to check against budget")
-
-
-class BudgetCheckOutput(BaseModel):
-    """Output schema for budget check tool."""
-
-    category: str
-    has_budget: bool
-    current_spent: float
-    limit: float
-    remaining: float
-    percentage_used: float
-    would_exceed: bool
-    impact_description: str
-
-
-class GoalCheckInput(BaseModel):
-    """Input schema for goal check tool."""
-
-    pass
-
-
-class GoalCheckOutput(BaseModel):
-    """Output schema for goal check tool."""
-
-    goals: list[dict]
-    total_goals: int
-    active_goals: int
-    total_target: float
-    total_current: float
-    total_remaining: float
-    impact_description: str
-
-
-class SpendingAnalysisInput(BaseModel):
-    """Input schema for spending analysis tool."""
-
-    pass
-
-
-class SpendingAnalysisOutput(BaseModel):
-    """Output schema for spending analysis tool."""
-
-    total_budget: float
-    total_spent: float
-    total_remaining: float
-    percentage_spent: float
-    financial_health_score: float
-    analysis_description: str
-
-
-class PastDecisionsInput(BaseModel):
-    """Input schema for past decisions tool."""
-
-    category: Optional[str] = Field(None, description="Category to filter by")
-    min_amount: Optional[float] = Field(None, description="Minimum purchase amount")
-    max_amount: Optional[float] = Field(None, description="Maximum purchase amount")
-    limit: int = Field(10, description="Maximum number of past decisions to return")
-
-
-class PastDecisionsOutput(BaseModel):
-    """Output schema for past decisions tool."""
-
-    decisions: list[dict]
-    total_decisions: int
-    average_score: float
-    category_patterns: dict
-    insights: str
-
-
-class RegretAnalysisInput(BaseModel):
-    """Input schema for regret analysis tool."""
-
-    category: Optional[str] = Field(None, description="Category to analyze")
-
-
-class RegretAnalysisOutput(BaseModel):
-    """Output schema for regret analysis tool."""
-
-    total_purchases: int
-    purchases_with_feedback: int
-    regretted_purchases: int
-    regret_rate: float
-    average_regret_level: float
-    common_regret_patterns: list[str]
-    recommendations: str
-
-
 def _build_budget_impact_description(
     category: str, spent: float, limit: float, amount: float
 ) -> str:
@@ -477,9 +384,7 @@ def create_decision_tools(
             }
 
         total_budget = float(budget.total_monthly)
-        total_spent = sum(
-            float(cat.get("spent", 0)) for cat in budget.categories.values()
-        )
+        total_spent = float(budget.total_spent)
         total_remaining = total_budget - total_spent
         percentage_spent = (total_spent / total_budget * 100) if total_budget > 0 else 0
 
@@ -551,9 +456,17 @@ def create_decision_tools(
         Returns:
             Past decisions with patterns and insights
         """
-        query = db_session.query(PurchaseDecision).filter(
-            PurchaseDecision.user_id == user_uuid
-        )
+        # Only the columns read below; skips the JSON analysis blobs
+        query = db_session.query(
+            PurchaseDecision.item_name,
+            PurchaseDecision.amount,
+            PurchaseDecision.category,
+            PurchaseDecision.score,
+            PurchaseDecision.decision_category,
+            PurchaseDecision.actual_purchase,
+            PurchaseDecision.regret_level,
+            PurchaseDecision.created_at,
+        ).filter(PurchaseDecision.user_id == user_uuid)
 
         if category:
             query = query.filter(PurchaseDecision.category == category.lower())
@@ -657,9 +570,14 @@ def create_decision_tools(
         Returns:
             Regret analysis with patterns and recommendations
         """
-        query = db_session.query(PurchaseDecision).filter(
-            PurchaseDecision.user_id == user_uuid
-        )
+        # Every decision is scanned, so fetch only the columns read below
+        query = db_session.query(
+            PurchaseDecision.amount,
+            PurchaseDecision.category,
+            PurchaseDecision.score,
+            PurchaseDecision.actual_purchase,
+            PurchaseDecision.regret_level,
+        ).filter(PurchaseDecision.user_id == user_uuid)
 
         if category:
             query = query.filter(PurchaseDecision.category == category.lower())
@@ -42,8 +42,18 @@ def create_feedback_tools(
         twenty_four_hours_ago = datetime.utcnow() - timedelta(hours=24)
 
         if item_name:
+            # Every recent decision is scanned for a match, so fetch only the
+            # columns returned below
             recent = (
-                db_session.query(PurchaseDecision)
+                db_session.query(
+                    PurchaseDecision.decision_id,
+                    PurchaseDecision.item_name,
+                    PurchaseDecision.amount,
+                    PurchaseDecision.category,
+                    PurchaseDecision.score,
+                    PurchaseDecision.decision_category,
+                    PurchaseDecision.actual_purchase,
+                )
                 .filter(
                     PurchaseDecision.user_id == user_uuid,
                     PurchaseDecision.created_at > twenty_four_hours_ago,
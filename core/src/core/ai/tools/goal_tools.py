@@ -116,7 +116,6 @@ def create_goal_tools(
         goal.current_amount = new_amount
         goal.updated_at = datetime.utcnow()
         db_session.commit()
-        db_session.refresh(goal)
 
         target = float(goal.target_amount)
         remaining = target - new_amount
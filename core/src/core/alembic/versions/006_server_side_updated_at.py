@@ -0,0 +1,38 @@
+"""default updated_at to now() on the server
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Let the database stamp updated_at for users and budgets.
+
+    The columns are naive UTC like created_at, so now() is converted from
+    the session TimeZone.
+    """
+    for table in ("users", "budgets"):
+        op.alter_column(
+            table,
+            "updated_at",
+            server_default=sa.func.timezone("utc", sa.func.now()),
+        )
+
+
+def downgrade() -> None:
+    """Drop the server-side updated_at defaults."""
+    for table in ("users", "budgets"):
+        op.alter_column(table, "updated_at", server_default=None)
@@ -0,0 +1,35 @@
+"""add composite indexes for active budget and recent decision lookups
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite lookup indexes."""
+    op.create_index(
+        "ix_budgets_user_active", "budgets", ["user_id", "period_end", "created_at"]
+    )
+    op.create_index(
+        "ix_purchase_decisions_user_created",
+        "purchase_decisions",
+        ["user_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop composite lookup indexes."""
+    op.drop_index("ix_purchase_decisions_user_created", table_name="purchase_decisions")
+    op.drop_index("ix_budgets_user_active", table_name="budgets")
@@ -0,0 +1,49 @@
+"""add pre-aggregated category totals to budgets
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add total_limit/total_spent and backfill them from categories."""
+    for column in ("total_limit", "total_spent"):
+        op.add_column(
+            "budgets",
+            sa.Column(column, sa.Numeric(10, 2), nullable=False, server_default="0"),
+        )
+
+    op.execute("""
+        UPDATE budgets
+        SET total_limit = totals.total_limit,
+            total_spent = totals.total_spent
+        FROM (
+            SELECT
+                b.budget_id,
+                COALESCE(SUM((c.value ->> 'limit')::numeric), 0) AS total_limit,
+                COALESCE(SUM((c.value ->> 'spent')::numeric), 0) AS total_spent
+            FROM budgets b
+            CROSS JOIN LATERAL json_each(b.categories) AS c
+            GROUP BY b.budget_id
+        ) AS totals
+        WHERE budgets.budget_id = totals.budget_id
+        """)
+
+
+def downgrade() -> None:
+    """Drop the category totals."""
+    op.drop_column("budgets", "total_spent")
+    op.drop_column("budgets", "total_limit")
@@ -0,0 +1,39 @@
+"""extend the recent decisions index with decision_id for keyset paging
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace (user_id, created_at) with (user_id, created_at, decision_id)."""
+    op.create_index(
+        "ix_purchase_decisions_user_created_id",
+        "purchase_decisions",
+        ["user_id", "created_at", "decision_id"],
+    )
+    op.drop_index("ix_purchase_decisions_user_created", table_name="purchase_decisions")
+
+
+def downgrade() -> None:
+    """Restore the two-column recent decisions index."""
+    op.create_index(
+        "ix_purchase_decisions_user_created",
+        "purchase_decisions",
+        ["user_id", "created_at"],
+    )
+    op.drop_index(
+        "ix_purchase_decisions_user_created_id", table_name="purchase_decisions"
+    )
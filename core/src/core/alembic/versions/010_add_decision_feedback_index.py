@@ -0,0 +1,35 @@
+"""add a partial index for decisions with feedback
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index (user_id, created_at) over decisions that have feedback."""
+    op.create_index(
+        "ix_purchase_decisions_user_feedback",
+        "purchase_decisions",
+        ["user_id", "created_at"],
+        postgresql_where=sa.text("actual_purchase IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the feedback index."""
+    op.drop_index(
+        "ix_purchase_decisions_user_feedback", table_name="purchase_decisions"
+    )
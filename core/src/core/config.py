@@ -15,6 +15,14 @@ class Settings(BaseSettings):
     jwt_secret_key: str = "your-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expiration_minutes: int = 60 * 24 * 7  # 7 days
+    jwt_cache_size: int = 4096  # Decoded tokens kept in the verification cache
+
+    # Raise on unintended lazy relationship loads in hot read paths
+    # (SQLA_STRICT_LOADING); meant for tests and staging
+    sqla_strict_loading: bool = False
+
+    # Password hashing
+    bcrypt_rounds: int = 12  # log2 work factor, pinned independently of bcrypt
 
     # Google OAuth
     google_client_id: str = ""
@@ -31,6 +39,23 @@ class Settings(BaseSettings):
     # Google AI (for Gemini)
     google_api_key: str = ""
 
+    # Conversation orchestrators kept in memory before the least recently
+    # used one is evicted
+    max_conversation_orchestrators: int = 1024
+
+    # Cart items analyzed at once by the decision agent
+    cart_analysis_concurrency: int = 4
+
+    # Per-user financial context reused across conversation turns; entries
+    # are also dropped whenever that user's budgets, goals or decisions change
+    context_cache_ttl_seconds: float = 30.0
+    context_cache_size: int = 10_000
+
+    # Decision stats and dashboard summaries per user; entries are also
+    # dropped whenever that user's decisions or budgets change
+    stats_cache_ttl_seconds: float = 60.0
+    stats_cache_size: int = 10_000
+
     # OpenTelemetry / Opik tracing
     # OTEL_EXPORTER_OTLP_ENDPOINT and OTEL_EXPORTER_OTLP_HEADERS are read
     # directly by the OTLPSpanExporter from the environment.
@@ -11,22 +11,51 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.sql.expression import FunctionElement
+
+from core.models.money import from_cents, to_cents
 
 Base = declarative_base()
 
 
+class _utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, computed by the database.
+
+    Matches the datetime.utcnow defaults of the other timestamp columns.
+    PostgreSQL's now() follows the session TimeZone, so it is converted;
+    SQLite's CURRENT_TIMESTAMP is already UTC.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(_utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(_utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
 class User(Base):
     """User model for authentication and profile."""
 
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     user_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -37,7 +66,9 @@ class User(Base):
     persona_tone = Column(String(50), default="balanced", nullable=True)
     strictness_level = Column(Integer, default=5, nullable=True)  # 1-10
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Stamped by the database on every INSERT/UPDATE; eager_defaults fetches
+    # it back in the same statement instead of a lazy SELECT later.
+    updated_at = Column(DateTime, server_default=_utcnow(), onupdate=_utcnow())
 
     # Relationships
     budgets = relationship(
@@ -53,6 +84,12 @@ class Budget(Base):
     """Budget model for tracking spending limits by category."""
 
     __tablename__ = "budgets"
+    __table_args__ = (
+        # Active-budget lookup: user_id = ? AND period covers today,
+        # newest created first
+        Index("ix_budgets_user_active", "user_id", "period_end", "created_at"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     budget_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False)
@@ -62,8 +99,14 @@ class Budget(Base):
     period_end = Column(Date, nullable=False)
     categories = Column(JSON, nullable=False)
     # Example: {"groceries": {"limit": 500, "spent": 250}, "clothes": {"limit": 300, "spent": 400}}
+    # Sums over categories, kept in step by _aggregate_categories so readers
+    # that only need totals don't walk the JSON
+    total_limit = Column(Numeric(10, 2), nullable=False, server_default="0")
+    total_spent = Column(Numeric(10, 2), nullable=False, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Stamped by the database on every INSERT/UPDATE; eager_defaults fetches
+    # it back in the same statement instead of a lazy SELECT later.
+    updated_at = Column(DateTime, server_default=_utcnow(), onupdate=_utcnow())
 
     # Relationships
     user = relationship("User", back_populates="budgets")
@@ -71,6 +114,18 @@ class Budget(Base):
         "BudgetItem", back_populates="budget", cascade="all, delete-orphan"
     )
 
+    @validates("categories")
+    def _aggregate_categories(self, key, categories):
+        """Refresh the category totals whenever categories is assigned."""
+        limit_cents = 0
+        spent_cents = 0
+        for details in categories.values():
+            limit_cents += to_cents(details.get("limit", 0))
+            spent_cents += to_cents(details.get("spent", 0))
+        self.total_limit = from_cents(limit_cents)
+        self.total_spent = from_cents(spent_cents)
+        return categories
+
 
 class BudgetItem(Base):
     """Budget item model for tracking individual spending events within budgets."""
@@ -147,6 +202,24 @@ class PurchaseDecision(Base):
     """Purchase decision model for tracking AI-assisted purchase decisions."""
 
     __tablename__ = "purchase_decisions"
+    __table_args__ = (
+        # Recent decisions for a user, newest first; decision_id makes the
+        # order total so list pages can seek on (created_at, decision_id)
+        Index(
+            "ix_purchase_decisions_user_created_id",
+            "user_id",
+            "created_at",
+            "decision_id",
+        ),
+        # Decisions with feedback, for the stats and dashboard trend charts;
+        # partial, so it stays as small as the set of rows the charts read
+        Index(
+            "ix_purchase_decisions_user_feedback",
+            "user_id",
+            "created_at",
+            postgresql_where=text("actual_purchase IS NOT NULL"),
+        ),
+    )
 
     decision_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False)
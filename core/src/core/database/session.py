@@ -11,8 +11,17 @@ class DatabaseManager:
 
     def __init__(self, database_url: str):
         """Initialize database manager with connection URL."""
-        self.engine = create_engine(database_url, pool_pre_ping=True)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.engine = create_engine(
+            database_url, pool_pre_ping=True, query_cache_size=1200
+        )
+        # Objects keep their loaded state after commit: services return what
+        # they just wrote, so expiring it would only force a reload SELECT.
+        self.SessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=self.engine,
+        )
 
     def create_tables(self):
         """Create all tables in the database."""
@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -39,6 +39,42 @@ class PurchaseCategory(str, Enum):
     IMPULSE = "impulse"
 
 
+# Literal mirrors of the enums above. Fields that only carry the raw string
+# (e.g. values read back from the database) use these so pydantic-core can
+# validate against its literal lookup table instead of going through EnumMeta.
+DecisionScoreLiteral = Literal[
+    "strong_no", "mild_no", "neutral", "mild_yes", "strong_yes"
+]
+BudgetCategoryLiteral = Literal[
+    "shopping", "dining", "entertainment", "groceries", "transport", "general"
+]
+PurchaseCategoryLiteral = Literal["essential", "discretionary", "investment", "impulse"]
+
+# Valid raw values, taken from the enums so a new member is never rejected
+DECISION_SCORES = frozenset(member.value for member in DecisionScore)
+BUDGET_CATEGORIES = frozenset(member.value for member in BudgetCategory)
+PURCHASE_CATEGORIES = frozenset(member.value for member in PurchaseCategory)
+
+
+# Score (1-10) -> category, indexed directly by score. Index 0 is unused.
+_SCORE_TO_CATEGORY: tuple[Optional[DecisionScore], ...] = (
+    (None,)
+    + (DecisionScore.STRONG_NO,) * 3
+    + (DecisionScore.MILD_NO,) * 2
+    + (DecisionScore.NEUTRAL,)
+    + (DecisionScore.MILD_YES,) * 2
+    + (DecisionScore.STRONG_YES,) * 2
+)
+
+
+def decision_category_for_score(score: int) -> DecisionScore:
+    """Map a 1-10 decision score to its DecisionScore category.
+
+    Scores outside the range are clamped to 1-10.
+    """
+    return _SCORE_TO_CATEGORY[min(max(score, 1), 10)]  # type: ignore[return-value]
+
+
 class PurchaseDecisionRequest(BaseModel):
     """Request to make a purchase decision."""
 
@@ -160,9 +196,9 @@ class PurchaseDecisionCreate(BaseModel):
     reason: Optional[str]
     urgency: Optional[str]
     score: int
-    decision_category: DecisionScore
+    decision_category: DecisionScoreLiteral
     reasoning: str
-    analysis: dict  # JSON field
+    analysis: DecisionAnalysis
     alternatives: Optional[list[str]]
     conditions: Optional[list[str]]
 
@@ -178,9 +214,12 @@ class PurchaseDecisionDB(BaseModel):
     reason: Optional[str]
     urgency: Optional[str]
     score: int
-    decision_category: DecisionScore
+    decision_category: DecisionScoreLiteral
     reasoning: str
-    analysis: dict
+    # Kept as a plain mapping: rows written by the conversational
+    # save_purchase_decision tool store a partial analysis (free-form budget
+    # categories, no opportunity cost) that doesn't fit DecisionAnalysis.
+    analysis: dict[str, Any]
     alternatives: Optional[list[str]]
     conditions: Optional[list[str]]
     created_at: datetime
@@ -188,7 +227,25 @@ class PurchaseDecisionDB(BaseModel):
     actual_purchase: Optional[bool] = None
     regret_level: Optional[int] = None
 
-    model_config = {"from_attributes": True, "populate_by_name": True}
+    model_config = {
+        "from_attributes": True,
+        "populate_by_name": True,
+        "frozen": True,
+    }
+
+    @classmethod
+    def from_orm_trusted(cls, row: Any) -> "PurchaseDecisionDB":
+        """Build from a purchase_decisions row without re-validating it.
+
+        The row was written by our own services, so model_validate's coercion
+        and checks add nothing on the list path.
+        """
+        return cls.model_construct(
+            **{
+                name: getattr(row, field.alias or name)
+                for name, field in cls.model_fields.items()
+            }
+        )
 
 
 class PurchaseDecisionListResponse(BaseModel):
@@ -198,6 +255,8 @@ class PurchaseDecisionListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    # Pass back as cursor to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
 
 
 class DecisionFeedback(BaseModel):
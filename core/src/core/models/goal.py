@@ -1,10 +1,13 @@
 """Pydantic models for Goal."""
 from datetime import date, datetime
 from decimal import Decimal
+from functools import cached_property
 from typing import Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+from core.models.money import to_cents
 
 
 class GoalBase(BaseModel):
@@ -42,14 +45,21 @@ class GoalResponse(GoalBase):
     is_completed: bool
     created_at: datetime
     updated_at: datetime
-    progress_percentage: float = Field(default=0.0)
 
     class Config:
         from_attributes = True
+        frozen = True
 
+    @computed_field  # type: ignore[prop-decorator]
     @property
+    def progress_percentage(self) -> float:
+        """Progress towards the target amount, as a percentage."""
+        return self.calculate_progress
+
+    @cached_property
     def calculate_progress(self) -> float:
-        """Calculate progress percentage."""
-        if self.target_amount == 0:
+        """Calculate progress percentage (computed once per instance)."""
+        target_cents = to_cents(self.target_amount)
+        if target_cents == 0:
             return 0.0
-        return float((self.current_amount / self.target_amount) * 100)
+        return to_cents(self.current_amount) * 100.0 / target_cents
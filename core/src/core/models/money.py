@@ -0,0 +1,29 @@
+"""Integer-cent helpers for exact money arithmetic."""
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Union
+
+Amount = Union[Decimal, float, int, str]
+
+_ONE = Decimal(1)
+
+
+def to_cents(value: Amount) -> int:
+    """Convert a monetary amount in major units to integer cents.
+
+    Args:
+        value: Amount in dollars (Decimal, float, int or numeric string)
+
+    Returns:
+        Amount in cents, rounded half up
+    """
+    if isinstance(value, int):
+        return value * 100
+    if isinstance(value, float):
+        return round(value * 100)
+    return int(Decimal(value).scaleb(2).quantize(_ONE, rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a two-place Decimal amount."""
+    return Decimal(cents).scaleb(-2)
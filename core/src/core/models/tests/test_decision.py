@@ -0,0 +1,33 @@
+"""Tests for purchase decision models."""
+
+from typing import get_args
+
+import pytest
+
+from core.models.decision import (
+    BUDGET_CATEGORIES,
+    DECISION_SCORES,
+    PURCHASE_CATEGORIES,
+    BudgetCategory,
+    BudgetCategoryLiteral,
+    DecisionScore,
+    DecisionScoreLiteral,
+    PurchaseCategory,
+    PurchaseCategoryLiteral,
+)
+
+
+@pytest.mark.parametrize(
+    ("enum", "literal", "values"),
+    [
+        (DecisionScore, DecisionScoreLiteral, DECISION_SCORES),
+        (BudgetCategory, BudgetCategoryLiteral, BUDGET_CATEGORIES),
+        (PurchaseCategory, PurchaseCategoryLiteral, PURCHASE_CATEGORIES),
+    ],
+)
+def test_literals_mirror_enums(enum, literal, values):
+    """Test each Literal and value set lists exactly the enum's values."""
+    enum_values = [member.value for member in enum]
+
+    assert list(get_args(literal)) == enum_values
+    assert values == frozenset(enum_values)
@@ -8,9 +8,13 @@ from pydantic import BaseModel, EmailStr, computed_field
 
 
 class UserBase(BaseModel):
-    """Base user model."""
+    """Base user model.
 
-    email: EmailStr
+    ``email`` is a plain string here; it is validated as ``EmailStr`` on ingress
+    (``UserCreate``) and read back from the database as already-valid data.
+    """
+
+    email: str
     full_name: Optional[str] = None
     profile_picture: Optional[str] = None
     persona_tone: Optional[str] = "balanced"
@@ -20,6 +24,7 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     """User creation model."""
 
+    email: EmailStr
     google_id: str
 
 
@@ -60,3 +65,4 @@ class UserResponse(UserBase):
 
     class Config:
         from_attributes = True
+        frozen = True
@@ -5,7 +5,43 @@ before sending data to observability platforms like Opik.
 """
 
 import re
-from typing import Any, Dict, Optional
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.config import settings
+
+# Keys whose values are replaced outright / rounded to the nearest 10.
+_FULL_REDACT_KEYS = frozenset({"email", "user_id", "full_name", "profile_picture"})
+_ROUND_KEYS = frozenset({"amount", "limit", "spent", "target_amount", "current_amount"})
+
+# Emails, UUIDs and dollar amounts are matched by one alternation so each
+# string is scanned once. Emails come first so an address that contains a
+# UUID-like local part is redacted as a whole; a dollar amount that runs
+# straight into an address (``$5@example.com``) is left for the email branch,
+# and a ``$`` directly before a UUID is skipped so the UUID branch gets it.
+_UUID_PATTERN = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b"
+_PII_RE = re.compile(
+    r"(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)"
+    rf"|(?P<uuid>\b{_UUID_PATTERN})"
+    rf"|(?P<dollar>\$(?!{_UUID_PATTERN})\d+(?:\.\d{{1,2}})?(?![A-Za-z0-9._%+-]*@))"
+)
+
+# Upper bounds (exclusive) of each amount bucket and the matching labels.
+_AMOUNT_RANGE_CUTS = (50, 100, 250, 500)
+_AMOUNT_RANGE_LABELS = ("$0-50", "$50-100", "$100-250", "$250-500", "$500+")
+
+
+def _replace_pii(match: "re.Match[str]") -> str:
+    kind = match.lastgroup
+    if kind == "email":
+        return "[EMAIL_REDACTED]"
+    if kind == "uuid":
+        return "[UUID_REDACTED]"
+    return f"${round(float(match.group()[1:]), -1):.0f}"
+
+
+def _redact_string(text: str) -> str:
+    return _PII_RE.sub(_replace_pii, text)
 
 
 class PIIRedactor:
@@ -21,63 +57,51 @@ class PIIRedactor:
         - Financial amounts (keeps only rounded values)
         - User names
 
+        Nested dicts and lists are walked with an explicit worklist rather
+        than recursion, so deeply nested payloads don't cost a Python frame
+        per node.
+
         Args:
             data: Data to redact
 
         Returns:
             Redacted data
         """
-        if isinstance(data, str):
-            # Redact email addresses
-            data = re.sub(
-                r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-                "[EMAIL_REDACTED]",
-                data,
-            )
-
-            # Redact UUIDs
-            data = re.sub(
-                r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
-                "[UUID_REDACTED]",
-                data,
-            )
-
-            # Redact specific dollar amounts (keep rounded)
-            data = re.sub(
-                r"\$\d+(\.\d{1,2})?",
-                lambda m: f"${round(float(m.group()[1:]), -1):.0f}",
-                data,
-            )
-
-            return data
-
-        elif isinstance(data, dict):
-            redacted = {}
-            for key, value in data.items():
-                # Redact sensitive keys entirely
-                if key.lower() in ["email", "user_id", "full_name", "profile_picture"]:
-                    redacted[key] = "[REDACTED]"
-                elif key.lower() in [
-                    "amount",
-                    "limit",
-                    "spent",
-                    "target_amount",
-                    "current_amount",
-                ]:
-                    # Round financial amounts to nearest 10
-                    if isinstance(value, (int, float)):
-                        redacted[key] = round(value, -1)
+        stack: List[Tuple[Any, Any]] = []
+
+        def visit(value: Any) -> Any:
+            # Strings and scalars are resolved immediately; containers get an
+            # empty copy that is filled in when their entry is popped.
+            if isinstance(value, str):
+                return _redact_string(value)
+            if isinstance(value, dict):
+                target: Any = {}
+            elif isinstance(value, list):
+                target = []
+            else:
+                return value
+            stack.append((value, target))
+            return target
+
+        result = visit(data)
+
+        while stack:
+            source, target = stack.pop()
+            if isinstance(source, dict):
+                for key, value in source.items():
+                    key_low = key.lower()
+                    if key_low in _FULL_REDACT_KEYS:
+                        # Redact sensitive keys entirely
+                        target[key] = "[REDACTED]"
+                    elif key_low in _ROUND_KEYS and isinstance(value, (int, float)):
+                        # Round financial amounts to nearest 10
+                        target[key] = round(value, -1)
                     else:
-                        redacted[key] = PIIRedactor.redact_pii(value)
-                else:
-                    redacted[key] = PIIRedactor.redact_pii(value)
-            return redacted
-
-        elif isinstance(data, list):
-            return [PIIRedactor.redact_pii(item) for item in data]
+                        target[key] = visit(value)
+            else:
+                target.extend([visit(item) for item in source])
 
-        else:
-            return data
+        return result
 
     @staticmethod
     def create_trace_attributes(
@@ -155,16 +179,7 @@ class PIIRedactor:
         Returns:
             Range string (e.g., "$0-50", "$50-100")
         """
-        if amount < 50:
-            return "$0-50"
-        elif amount < 100:
-            return "$50-100"
-        elif amount < 250:
-            return "$100-250"
-        elif amount < 500:
-            return "$250-500"
-        else:
-            return "$500+"
+        return _AMOUNT_RANGE_LABELS[bisect_right(_AMOUNT_RANGE_CUTS, amount)]
 
 
 # Convenience functions for common use cases
@@ -189,6 +204,9 @@ def create_trace_attributes(
 ) -> Dict[str, Any]:
     """Create trace attributes with PII redaction.
 
+    When tracing is disabled nothing is exported, so redaction is skipped and
+    an empty dict is returned.
+
     Args:
         user_id: User ID (will be redacted)
         session_id: Session ID
@@ -199,6 +217,9 @@ def create_trace_attributes(
     Returns:
         Dictionary of trace attributes
     """
+    if not settings.opik_tracing_enabled:
+        return {}
+
     return PIIRedactor.create_trace_attributes(
         user_id=user_id,
         session_id=session_id,
@@ -0,0 +1 @@
+"""Tests for observability utilities."""
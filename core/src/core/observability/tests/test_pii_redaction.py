@@ -0,0 +1,32 @@
+"""Tests for PII redaction."""
+
+import pytest
+
+from core.observability.pii_redaction import redact_pii
+
+UUID = "12345678-1234-1234-1234-123456789abc"
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Ping jane.doe@example.com", "Ping [EMAIL_REDACTED]"),
+        (f"decision {UUID}", "decision [UUID_REDACTED]"),
+        ("Spent $123.45 today", "Spent $120 today"),
+        ("$5@example.com", "$[EMAIL_REDACTED]"),
+        (f"${UUID}", "$[UUID_REDACTED]"),
+    ],
+)
+def test_redact_pii_strings(text, expected):
+    """Test emails, UUIDs and dollar amounts in free text."""
+    assert redact_pii(text) == expected
+
+
+def test_redact_pii_nested():
+    """Test sensitive keys are dropped and amounts rounded in nested data."""
+    data = {"user_id": UUID, "items": [{"amount": 123.4, "note": f"id {UUID}"}]}
+
+    assert redact_pii(data) == {
+        "user_id": "[REDACTED]",
+        "items": [{"amount": 120.0, "note": "id [UUID_REDACTED]"}],
+    }
@@ -13,11 +13,18 @@ directly from the standard environment variables:
 so no manual parsing is needed here.
 """
 
-from strands.telemetry import StrandsTelemetry
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
 
 from core.config import settings
 
+if TYPE_CHECKING:
+    from strands.telemetry import StrandsTelemetry
+
 _telemetry: StrandsTelemetry | None = None
+_lock = threading.Lock()
 
 
 def setup_tracing() -> None:
@@ -26,15 +33,21 @@ def setup_tracing() -> None:
     Relies on ``OTEL_EXPORTER_OTLP_ENDPOINT`` and
     ``OTEL_EXPORTER_OTLP_HEADERS`` being set in the environment.
 
-    Safe to call multiple times; only the first invocation takes effect.
+    Safe to call multiple times (and from multiple threads); only the first
+    invocation takes effect. The telemetry package is only imported when
+    tracing is enabled.
     """
     global _telemetry
 
-    if _telemetry is not None:
+    if not settings.opik_tracing_enabled or _telemetry is not None:
         return
 
-    if not settings.opik_tracing_enabled:
-        return
+    with _lock:
+        if _telemetry is not None:
+            return
+
+        from strands.telemetry import StrandsTelemetry
 
-    _telemetry = StrandsTelemetry()
-    _telemetry.setup_otlp_exporter()
+        telemetry = StrandsTelemetry()
+        telemetry.setup_otlp_exporter()
+        _telemetry = telemetry
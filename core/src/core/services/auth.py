@@ -1,16 +1,65 @@
-"""Authentication service for Google OAuth and JWT."""
+"""Authentication service for Google OAuth and JWT.
 
+Password checks go through ``bcrypt.checkpw``, which compares hashes in
+constant time. Any code that ever compares hashes or tokens directly must use
+``hmac.compare_digest`` rather than ``==`` to keep that property.
+"""
+
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 from uuid import UUID
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session
 
 from core.config import settings
 from core.database.models import User
 
+# Hot lookups are built once so SQLAlchemy's compiled cache is hit directly
+_user_by_id_stmt = select(User).where(User.user_id == bindparam("user_id"))
+_user_by_google_id_stmt = select(User).where(User.google_id == bindparam("google_id"))
+
+# JWT settings are read on every token operation, so bind them once at import
+# time; call reload_jwt_settings() after changing them at runtime.
+_jwt_secret_key = settings.jwt_secret_key
+_jwt_algorithm = settings.jwt_algorithm
+_jwt_algorithms = [_jwt_algorithm]
+_jwt_expiration = timedelta(minutes=settings.jwt_expiration_minutes)
+
+
+@lru_cache(maxsize=settings.jwt_cache_size)
+def _decode_token(token: str) -> Optional[Tuple[Optional[str], Optional[int]]]:
+    """Decode and verify a JWT once, returning its (sub, exp) claims.
+
+    Invalid tokens are cached as None so repeated bad tokens aren't re-parsed.
+    Expiry is checked by the caller on every use, so a cached token still
+    stops working once it expires.
+    """
+    try:
+        payload = jwt.decode(token, _jwt_secret_key, algorithms=_jwt_algorithms)
+    except jwt.PyJWTError:
+        return None
+    return payload.get("sub"), payload.get("exp")
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token verifications (e.g. after rotating the secret)."""
+    _decode_token.cache_clear()
+
+
+def reload_jwt_settings() -> None:
+    """Rebind the JWT settings (e.g. after rotating the secret)."""
+    global _jwt_secret_key, _jwt_algorithm, _jwt_algorithms, _jwt_expiration
+    _jwt_secret_key = settings.jwt_secret_key
+    _jwt_algorithm = settings.jwt_algorithm
+    _jwt_algorithms = [_jwt_algorithm]
+    _jwt_expiration = timedelta(minutes=settings.jwt_expiration_minutes)
+    clear_token_cache()
+
 
 class AuthService:
     """Handle authentication logic."""
@@ -21,45 +70,61 @@ class AuthService:
 
     def create_access_token(self, user_id: str) -> str:
         """Create JWT access token."""
-        expire = datetime.utcnow() + timedelta(minutes=settings.jwt_expiration_minutes)
+        now = datetime.utcnow()
         to_encode = {
             "sub": str(user_id),
-            "exp": expire,
-            "iat": datetime.utcnow(),
+            "exp": now + _jwt_expiration,
+            "iat": now,
         }
-        encoded_jwt = jwt.encode(
-            to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-        )
-        return encoded_jwt
+        return jwt.encode(to_encode, _jwt_secret_key, algorithm=_jwt_algorithm)
 
     def verify_token(self, token: str) -> Optional[str]:
         """Verify JWT token and return user_id."""
-        try:
-            payload = jwt.decode(
-                token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
-            )
-            user_id = payload.get("sub")
-
-            return user_id
-        except JWTError:
+        decoded = _decode_token(token)
+        if decoded is None:
+            return None
+
+        user_id, expires_at = decoded
+        if expires_at is not None and expires_at <= time.time():
             return None
 
+        return user_id
+
     def get_or_create_user(self, google_user_data: dict) -> User:
         """Get existing user or create new one from Google data."""
         google_id = google_user_data.get("sub")
         email = google_user_data.get("email")
 
-        # Try to find existing user by google_id
-        user = self.db.query(User).filter(User.google_id == google_id).first()
-
-        if user:
-            # Update user info if changed
-            user.full_name = google_user_data.get("name", user.full_name)
-            user.profile_picture = google_user_data.get("picture", user.profile_picture)
-            user.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(user)
-            return user
+        # Returning user: refresh profile info with a single UPDATE ... RETURNING
+        # where the dialect supports it, instead of SELECT + UPDATE + refresh.
+        # (google_id must be set, or the WHERE would match every password user.)
+        if google_id is not None and self.db.get_bind().dialect.update_returning:
+            values = {}
+            if "name" in google_user_data:
+                values["full_name"] = google_user_data["name"]
+            if "picture" in google_user_data:
+                values["profile_picture"] = google_user_data["picture"]
+
+            user = self.db.execute(
+                update(User)
+                .where(User.google_id == google_id)
+                .values(**values)
+                .returning(User),
+                execution_options={"populate_existing": True},
+            ).scalar_one_or_none()
+            if user:
+                self.db.commit()
+                return user
+        else:
+            user = self.db.query(User).filter(User.google_id == google_id).first()
+            if user:
+                # Update user info if changed
+                user.full_name = google_user_data.get("name", user.full_name)
+                user.profile_picture = google_user_data.get(
+                    "picture", user.profile_picture
+                )
+                self.db.commit()
+                return user
 
         # Check if user exists by email (in case they signed up differently)
         user = self.db.query(User).filter(User.email == email).first()
@@ -68,9 +133,7 @@ class AuthService:
             user.google_id = google_id
             user.full_name = google_user_data.get("name", user.full_name)
             user.profile_picture = google_user_data.get("picture", user.profile_picture)
-            user.updated_at = datetime.utcnow()
             self.db.commit()
-            self.db.refresh(user)
             return user
 
         # Create new user
@@ -82,43 +145,48 @@ class AuthService:
         )
         self.db.add(new_user)
         self.db.commit()
-        self.db.refresh(new_user)
         return new_user
 
     def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
-        return self.db.query(User).filter(User.user_id == user_id).first()
+        return self.db.execute(
+            _user_by_id_stmt, {"user_id": user_id}
+        ).scalar_one_or_none()
 
     def get_user_by_google_id(self, google_id: str) -> Optional[User]:
         """Get user by Google ID."""
-        return self.db.query(User).filter(User.google_id == google_id).first()
+        return self.db.execute(
+            _user_by_google_id_stmt, {"google_id": google_id}
+        ).scalar_one_or_none()
 
     def hash_password(self, password: str) -> str:
         """Hash a password using bcrypt."""
-        # Ensure password is truncated to 72 bytes for bcrypt
-        password_bytes = password.encode("utf-8")
-        if len(password_bytes) > 72:
-            password_bytes = password_bytes[:72]
+        # bcrypt only uses the first 72 bytes of the password
+        password_bytes = password.encode("utf-8")[:72]
 
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode("utf-8")
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against a hash."""
-        password_bytes = plain_password.encode("utf-8")
-        if len(password_bytes) > 72:
-            password_bytes = password_bytes[:72]
+    def verify_password(
+        self, plain_password: str, hashed_password: Union[str, bytes]
+    ) -> bool:
+        """Verify a password against a hash (str as stored, or raw bytes)."""
+        password_bytes = plain_password.encode("utf-8")[:72]
 
-        return bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
+        if isinstance(hashed_password, str):
+            hashed_password = hashed_password.encode("utf-8")
+        return bcrypt.checkpw(password_bytes, hashed_password)
 
     def create_user_with_password(
         self, email: str, password: str, full_name: Optional[str] = None
     ) -> User:
         """Create a new user with email and password."""
         # Check if user already exists
-        existing = self.db.query(User).filter(User.email == email).first()
-        if existing:
+        email_taken = self.db.query(
+            self.db.query(User).filter(User.email == email).exists()
+        ).scalar()
+        if email_taken:
             raise ValueError("User with this email already exists")
 
         # Validate password length (bcrypt has 72 byte limit)
@@ -133,7 +201,6 @@ class AuthService:
         )
         self.db.add(user)
         self.db.commit()
-        self.db.refresh(user)
         return user
 
     def authenticate_user(self, email: str, password: str) -> Optional[User]:
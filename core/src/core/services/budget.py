@@ -1,20 +1,77 @@
 """Budget management service."""
 
-from datetime import datetime
-from decimal import Decimal
-from typing import List, Optional
+from collections import deque
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    JSON,
+    String,
+    and_,
+    bindparam,
+    case,
+    column,
+    func,
+    select,
+    true,
+)
+from sqlalchemy.orm import Session, raiseload, selectinload
 
+from core.config import settings
 from core.database.models import Budget, BudgetItem
 from core.models.budget import (
     BudgetAnalysisOverTime,
     BudgetCreate,
     BudgetItemCreate,
     BudgetUpdate,
+    CategoryBudget,
+)
+from core.models.money import from_cents, to_cents
+
+# Hot lookups are built once so SQLAlchemy's compiled cache is hit directly
+_budget_by_id_stmt = select(Budget).where(
+    Budget.budget_id == bindparam("budget_id"),
+    Budget.user_id == bindparam("user_id"),
+)
+_budget_with_items_stmt = _budget_by_id_stmt.options(selectinload(Budget.budget_items))
+_active_budget_stmt = (
+    select(Budget)
+    .where(
+        Budget.user_id == bindparam("user_id"),
+        Budget.period_start <= bindparam("today"),
+        Budget.period_end >= bindparam("today"),
+    )
+    .order_by(Budget.created_at.desc())
+    .limit(1)
 )
+# With settings.sqla_strict_loading on, any lazy relationship load from the
+# active budget raises instead of silently issuing one query per access
+_active_budget_strict_stmt = _active_budget_stmt.options(raiseload("*"))
+
+
+def _categories_for_storage(
+    categories: Dict[str, CategoryBudget],
+) -> Dict[str, Dict[str, float]]:
+    """Convert category models to the JSON shape stored on Budget.categories."""
+    return {
+        key: {"limit": float(value.limit), "spent": float(value.spent)}
+        for key, value in categories.items()
+    }
+
+
+class PeriodRow(NamedTuple):
+    """One budget period in a multi-period analysis."""
+
+    budget_id: str
+    name: str
+    period_start: str
+    period_end: str
+    total_limit: float
+    total_spent: float
+    adherence_percentage: float
+    over_budget_categories: int
 
 
 class BudgetService:
@@ -23,50 +80,95 @@ class BudgetService:
     def __init__(self, db: Session):
         """Initialize budget service."""
         self.db = db
+        self._in_transaction = False
+        # Active budget per (user, day), reused for the lifetime of the
+        # service (one request or one agent turn). Invalidated whenever a
+        # budget is created, updated or deleted through this service.
+        self._active_budget_cache: Dict[Tuple[UUID, date], Budget] = {}
+
+    @contextmanager
+    def transaction(self) -> Iterator["BudgetService"]:
+        """Group several mutations into a single commit.
+
+        Inside the block, mutators only flush; the commit happens once on
+        exit, or everything is rolled back if the block raises.
+
+        Example:
+            with budget_service.transaction():
+                budget_service.add_category(...)
+                budget_service.add_budget_item(...)
+        """
+        if self._in_transaction:
+            yield self
+            return
+
+        self._in_transaction = True
+        try:
+            yield self
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+
+    def _commit(self) -> None:
+        """Commit, or just flush when running inside transaction()."""
+        if self._in_transaction:
+            self.db.flush()
+        else:
+            self.db.commit()
+
+    @staticmethod
+    def _with_category(categories: dict, category: str, **values: float) -> dict:
+        """Return a new categories mapping with one category's fields replaced.
+
+        Only the touched entry is rebuilt; the loaded JSON is never mutated in
+        place, so the column compares as changed on flush without needing
+        flag_modified, and the session's committed snapshot stays intact.
+        """
+        updated = dict(categories)
+        updated[category] = {**categories.get(category, {}), **values}
+        return updated
 
     def create_budget(self, user_id: UUID, budget_data: BudgetCreate) -> Budget:
         """Create a new budget."""
-        # Convert Pydantic models to dict for JSON storage
-        # Convert Decimals to floats for JSON compatibility
-        categories_dict = {
-            key: {"limit": float(value.limit), "spent": float(value.spent)}
-            for key, value in budget_data.categories.items()
-        }
-
+        self._active_budget_cache.clear()
         budget = Budget(
             user_id=user_id,
             name=budget_data.name,
             total_monthly=budget_data.total_monthly,
             period_start=budget_data.period_start,
             period_end=budget_data.period_end,
-            categories=categories_dict,
+            categories=_categories_for_storage(budget_data.categories),
         )
         self.db.add(budget)
-        self.db.commit()
-        self.db.refresh(budget)
+        self._commit()
         return budget
 
     def get_budget(self, budget_id: UUID, user_id: UUID) -> Optional[Budget]:
         """Get a budget by ID for a specific user."""
-        return (
-            self.db.query(Budget)
-            .filter(Budget.budget_id == budget_id, Budget.user_id == user_id)
-            .first()
-        )
+        return self.db.execute(
+            _budget_by_id_stmt, {"budget_id": budget_id, "user_id": user_id}
+        ).scalar_one_or_none()
 
     def get_active_budget(self, user_id: UUID) -> Optional[Budget]:
         """Get the currently active budget for a user (period contains today)."""
         today = datetime.utcnow().date()
-        return (
-            self.db.query(Budget)
-            .filter(
-                Budget.user_id == user_id,
-                Budget.period_start <= today,
-                Budget.period_end >= today,
+        cache_key = (user_id, today)
+        budget = self._active_budget_cache.get(cache_key)
+        if budget is None:
+            stmt = (
+                _active_budget_strict_stmt
+                if settings.sqla_strict_loading
+                else _active_budget_stmt
             )
-            .order_by(Budget.created_at.desc())
-            .first()
-        )
+            budget = self.db.execute(
+                stmt, {"user_id": user_id, "today": today}
+            ).scalar_one_or_none()
+            if budget is not None:
+                self._active_budget_cache[cache_key] = budget
+        return budget
 
     def list_budgets(
         self, user_id: UUID, skip: int = 0, limit: int = 100
@@ -85,70 +187,94 @@ class BudgetService:
         self, budget_id: UUID, user_id: UUID, budget_update: BudgetUpdate
     ) -> Optional[Budget]:
         """Update a budget."""
+        self._active_budget_cache.clear()
         budget = self.get_budget(budget_id, user_id)
         if not budget:
             return None
 
-        update_data = budget_update.model_dump(exclude_unset=True)
-
-        # Convert categories if present (they're already dicts after model_dump)
-        if "categories" in update_data and update_data["categories"]:
-            categories_dict = {}
-            for key, value in update_data["categories"].items():
-                if isinstance(value, dict):
-                    # Already a dict from model_dump, ensure floats
-                    categories_dict[key] = {
-                        "limit": float(value.get("limit", 0)),
-                        "spent": float(value.get("spent", 0)),
-                    }
-                else:
-                    # Pydantic model (shouldn't happen but handle it)
-                    categories_dict[key] = {
-                        "limit": float(value.limit),
-                        "spent": float(value.spent),
-                    }
-            update_data["categories"] = categories_dict
+        # Categories are converted straight from the models rather than
+        # being dumped to nested dicts first and then converted again
+        update_data = budget_update.model_dump(
+            exclude_unset=True, exclude={"categories"}
+        )
+        if "categories" in budget_update.model_fields_set:
+            categories = budget_update.categories
+            update_data["categories"] = (
+                _categories_for_storage(categories) if categories else categories
+            )
 
         for key, value in update_data.items():
             setattr(budget, key, value)
 
-        budget.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(budget)
+        self._commit()
         return budget
 
     def delete_budget(self, budget_id: UUID, user_id: UUID) -> bool:
         """Delete a budget."""
+        self._active_budget_cache.clear()
         budget = self.get_budget(budget_id, user_id)
         if not budget:
             return False
 
         self.db.delete(budget)
-        self.db.commit()
+        self._commit()
         return True
 
     def update_category_spending(
         self, budget_id: UUID, user_id: UUID, category: str, amount: float
     ) -> Optional[Budget]:
         """Update spending amount for a specific category."""
-        budget = self.get_budget(budget_id, user_id)
-        if not budget or category not in budget.categories:
-            return None
+        updated = self.bulk_update_category_spending(
+            [(budget_id, user_id, category, amount)]
+        )
+        return updated[0] if updated else None
 
-        # Update the spending amount
-        categories_copy = budget.categories.copy()
-        categories_copy[category]["spent"] = float(amount)
-        budget.categories = categories_copy
+    def bulk_update_category_spending(
+        self, updates: List[Tuple[UUID, UUID, str, float]]
+    ) -> List[Budget]:
+        """Set spending for many budget categories with a single commit.
 
-        # Flag as modified for SQLAlchemy to detect the change
-        from sqlalchemy.orm.attributes import flag_modified
+        All affected budgets are loaded with one query and the whole batch is
+        committed once, instead of one commit per category update.
 
-        flag_modified(budget, "categories")
+        Args:
+            updates: (budget_id, user_id, category, amount) entries; later
+                entries for the same category win
 
-        budget.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(budget)
-        return budget
+        Returns:
+            Budgets that were changed. Entries for unknown budgets, budgets
+            owned by another user or missing categories are skipped.
+        """
+        if not updates:
+            return []
+
+        budgets = {
+            budget.budget_id: budget
+            for budget in self.db.execute(
+                select(Budget).where(
+                    Budget.budget_id.in_({update[0] for update in updates}),
+                    Budget.user_id.in_({update[1] for update in updates}),
+                )
+            ).scalars()
+        }
+
+        changed: Dict[UUID, Budget] = {}
+        for budget_id, user_id, category, amount in updates:
+            budget = budgets.get(budget_id)
+            if (
+                budget is None
+                or budget.user_id != user_id
+                or category not in budget.categories
+            ):
+                continue
+            budget.categories = self._with_category(
+                budget.categories, category, spent=float(amount)
+            )
+            changed[budget_id] = budget
+
+        if changed:
+            self._commit()
+        return list(changed.values())
 
     def update_category_limit(
         self, budget_id: UUID, user_id: UUID, category: str, new_limit: float
@@ -159,22 +285,14 @@ class BudgetService:
             return None
 
         # Update the limit
-        categories_copy = budget.categories.copy()
-        categories_copy[category]["limit"] = float(new_limit)
-        budget.categories = categories_copy
+        budget.categories = self._with_category(
+            budget.categories, category, limit=float(new_limit)
+        )
 
         # Update total monthly budget to reflect change
-        total_limit = sum(cat["limit"] for cat in categories_copy.values())
-        budget.total_monthly = Decimal(str(total_limit))
-
-        # Flag as modified for SQLAlchemy to detect the change
-        from sqlalchemy.orm.attributes import flag_modified
+        budget.total_monthly = budget.total_limit
 
-        flag_modified(budget, "categories")
-
-        budget.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(budget)
+        self._commit()
         return budget
 
     def add_category(
@@ -188,20 +306,13 @@ class BudgetService:
         if category in budget.categories:
             return budget  # Already exists
 
-        categories_copy = budget.categories.copy()
-        categories_copy[category] = {"limit": float(limit), "spent": 0}
-        budget.categories = categories_copy
-
-        total_limit = sum(cat["limit"] for cat in categories_copy.values())
-        budget.total_monthly = Decimal(str(total_limit))
-
-        from sqlalchemy.orm.attributes import flag_modified
+        budget.categories = self._with_category(
+            budget.categories, category, limit=float(limit), spent=0
+        )
 
-        flag_modified(budget, "categories")
+        budget.total_monthly = budget.total_limit
 
-        budget.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(budget)
+        self._commit()
         return budget
 
     def add_budget_item(
@@ -227,12 +338,14 @@ class BudgetService:
 
         # Get current category state
         category_info = budget.categories[category]
-        spent_before = Decimal(str(category_info.get("spent", 0)))
-        limit = Decimal(str(category_info.get("limit", 0)))
-        spent_after = spent_before + item_data.amount
+        # Work in integer cents; the JSON blob keeps plain dollar floats so
+        # existing rows and API consumers are unaffected.
+        spent_before_cents = to_cents(category_info.get("spent", 0))
+        limit_cents = to_cents(category_info.get("limit", 0))
+        spent_after_cents = spent_before_cents + to_cents(item_data.amount)
 
         # Check if this exceeds budget
-        exceeded_budget = spent_after > limit
+        exceeded_budget = spent_after_cents > limit_cents
 
         # Create budget item
         budget_item = BudgetItem(
@@ -244,26 +357,20 @@ class BudgetService:
             transaction_date=item_data.transaction_date,
             decision_id=item_data.decision_id,
             exceeded_budget=exceeded_budget,
-            category_spent_before=spent_before,
-            category_spent_after=spent_after,
-            category_limit=limit,
+            category_spent_before=from_cents(spent_before_cents),
+            category_spent_after=from_cents(spent_after_cents),
+            category_limit=from_cents(limit_cents),
             notes=item_data.notes,
             is_planned=item_data.is_planned,
         )
         # Update budget category spending before adding item to avoid
         # SAWarning: Session.add() during flush (triggered by dirty budget state)
-        categories_copy = budget.categories.copy()
-        categories_copy[category]["spent"] = float(spent_after)
-        budget.categories = categories_copy
-
-        from sqlalchemy.orm.attributes import flag_modified
-
-        flag_modified(budget, "categories")
-        budget.updated_at = datetime.utcnow()
+        budget.categories = self._with_category(
+            budget.categories, category, spent=spent_after_cents / 100
+        )
 
         self.db.add(budget_item)
-        self.db.commit()
-        self.db.refresh(budget_item)
+        self._commit()
         return budget_item
 
     def get_budget_items(
@@ -292,13 +399,10 @@ class BudgetService:
 
     def get_budget_with_items(self, budget_id: UUID, user_id: UUID) -> Optional[Budget]:
         """Get budget with all its items loaded."""
-        budget = self.get_budget(budget_id, user_id)
-        if not budget:
-            return None
-
-        # Eagerly load items
-        self.db.refresh(budget, ["budget_items"])
-        return budget
+        return self.db.execute(
+            _budget_with_items_stmt,
+            {"budget_id": budget_id, "user_id": user_id},
+        ).scalar_one_or_none()
 
     def analyze_budgets_over_time(
         self, user_id: UUID, num_periods: int = 6
@@ -308,16 +412,54 @@ class BudgetService:
         This provides insights into spending trends and budget adherence
         over time, which can influence guard scores.
         """
-        # Get recent budgets ordered by period_start
-        budgets = (
-            self.db.query(Budget)
-            .filter(Budget.user_id == user_id)
+        # Most recent budgets for the user; categories are unpacked in SQL
+        # with json_each so per-period and per-category totals are aggregated
+        # by the database instead of walking every JSON blob in Python.
+        recent = (
+            select(
+                Budget.budget_id,
+                Budget.name,
+                Budget.period_start,
+                Budget.period_end,
+                Budget.total_monthly,
+                Budget.categories,
+            )
+            .where(Budget.user_id == user_id)
             .order_by(Budget.period_start.desc())
             .limit(num_periods)
-            .all()
+            .subquery()
+        )
+        category = (
+            func.json_each(recent.c.categories)
+            .table_valued(column("key", String), column("value", JSON))
+            .alias("category")
         )
+        spent = func.coalesce(category.c.value["spent"].as_float(), 0.0)
+        limit = func.coalesce(category.c.value["limit"].as_float(), 0.0)
+
+        period_rows = self.db.execute(
+            select(
+                recent.c.budget_id,
+                recent.c.name,
+                recent.c.period_start,
+                recent.c.period_end,
+                recent.c.total_monthly,
+                func.coalesce(func.sum(spent), 0.0).label("total_spent"),
+                func.count(case((spent > limit, 1))).label("over_budget"),
+            )
+            .select_from(recent)
+            .outerjoin(category, true())
+            .group_by(
+                recent.c.budget_id,
+                recent.c.name,
+                recent.c.period_start,
+                recent.c.period_end,
+                recent.c.total_monthly,
+            )
+            .order_by(recent.c.period_start)  # Oldest to newest for trend analysis
+        ).all()
 
-        if not budgets:
+        if not period_rows:
             return BudgetAnalysisOverTime(
                 periods=[],
                 average_adherence=100.0,
@@ -326,88 +468,87 @@ class BudgetService:
                 over_budget_count=0,
             )
 
-        # Analyze each period
-        periods = []
-        adherence_scores = []
+        # Analyze each period, keeping a running total and a rolling window of
+        # the last three scores so the trend needs no second pass
+        periods: List[PeriodRow] = []
+        adherence_total = 0.0
+        recent_scores: Deque[float] = deque(maxlen=3)
         over_budget_count = 0
-        category_data = {}
 
-        for budget in reversed(budgets):  # Oldest to newest for trend analysis
-            total_limit = float(budget.total_monthly)
-            total_spent = sum(
-                cat_info.get("spent", 0) for cat_info in budget.categories.values()
-            )
+        for row in period_rows:
+            total_limit = float(row.total_monthly)
+            total_spent = float(row.total_spent)
             adherence = (
                 ((total_limit - total_spent) / total_limit * 100)
                 if total_limit > 0
                 else 100.0
             )
             adherence = max(0, adherence)  # Cap at 0 if overspent
-            adherence_scores.append(adherence)
-
-            # Count over-budget categories
-            period_over_budget = sum(
-                1
-                for cat_info in budget.categories.values()
-                if cat_info.get("spent", 0) > cat_info.get("limit", 0)
-            )
-            over_budget_count += period_over_budget
-
-            # Collect category data
-            for cat_name, cat_info in budget.categories.items():
-                if cat_name not in category_data:
-                    category_data[cat_name] = {
-                        "periods": [],
-                        "limits": [],
-                        "spent": [],
-                    }
-                category_data[cat_name]["periods"].append(str(budget.period_start))
-                category_data[cat_name]["limits"].append(cat_info.get("limit", 0))
-                category_data[cat_name]["spent"].append(cat_info.get("spent", 0))
+            adherence_total += adherence
+            recent_scores.append(adherence)
+            over_budget_count += row.over_budget
 
             periods.append(
-                {
-                    "budget_id": str(budget.budget_id),
-                    "name": budget.name,
-                    "period_start": str(budget.period_start),
-                    "period_end": str(budget.period_end),
-                    "total_limit": total_limit,
-                    "total_spent": total_spent,
-                    "adherence_percentage": round(adherence, 2),
-                    "over_budget_categories": period_over_budget,
-                }
+                PeriodRow(
+                    str(row.budget_id),
+                    row.name,
+                    str(row.period_start),
+                    str(row.period_end),
+                    total_limit,
+                    total_spent,
+                    round(adherence, 2),
+                    row.over_budget,
+                )
             )
 
         # Calculate trend
-        average_adherence = sum(adherence_scores) / len(adherence_scores)
+        num_scores = len(period_rows)
+        average_adherence = adherence_total / num_scores
 
         trend = "stable"
-        if len(adherence_scores) >= 3:
+        if num_scores >= 3:
             # Compare recent 3 periods to previous periods
-            recent_avg = sum(adherence_scores[-3:]) / 3
-            if len(adherence_scores) > 3:
-                older_avg = sum(adherence_scores[:-3]) / (len(adherence_scores) - 3)
+            recent_total = sum(recent_scores)
+            recent_avg = recent_total / 3
+            if num_scores > 3:
+                older_avg = (adherence_total - recent_total) / (num_scores - 3)
                 if recent_avg > older_avg + 10:
                     trend = "improving"
                 elif recent_avg < older_avg - 10:
                     trend = "declining"
 
-        # Create category insights
-        category_insights = {}
-        for cat_name, cat_info in category_data.items():
-            avg_spent = sum(cat_info["spent"]) / len(cat_info["spent"])
-            avg_limit = sum(cat_info["limits"]) / len(cat_info["limits"])
-            utilization = (avg_spent / avg_limit * 100) if avg_limit > 0 else 0
-
-            category_insights[cat_name] = {
-                "average_spent": round(avg_spent, 2),
-                "average_limit": round(avg_limit, 2),
-                "average_utilization": round(utilization, 2),
-                "periods_tracked": len(cat_info["periods"]),
+        # Create category insights; utilization is derived in the same
+        # aggregate so every category is computed in one set-based pass.
+        avg_spent = func.avg(spent)
+        avg_limit = func.avg(limit)
+        category_rows = self.db.execute(
+            select(
+                category.c.key,
+                avg_spent.label("average_spent"),
+                avg_limit.label("average_limit"),
+                case((avg_limit > 0, avg_spent / avg_limit * 100), else_=0.0).label(
+                    "average_utilization"
+                ),
+                func.count().label("periods_tracked"),
+            )
+            .select_from(recent)
+            .join(category, true())
+            .group_by(category.c.key)
+            .order_by(category.c.key)
+        ).all()
+
+        category_insights = {
+            row.key: {
+                "average_spent": round(float(row.average_spent), 2),
+                "average_limit": round(float(row.average_limit), 2),
+                "average_utilization": round(float(row.average_utilization), 2),
+                "periods_tracked": row.periods_tracked,
             }
+            for row in category_rows
+        }
 
         return BudgetAnalysisOverTime(
-            periods=periods,
+            periods=[period._asdict() for period in periods],
             average_adherence=round(average_adherence, 2),
             trend=trend,
             category_insights=category_insights,
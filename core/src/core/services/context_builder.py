@@ -4,11 +4,27 @@ Builds a UserFinancialContext once per request with standardized queries,
 eliminating redundant DB lookups across the intent classifier, agents, and handlers.
 """
 
-from datetime import date, datetime, timedelta
-from decimal import Decimal
+from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Date,
+    DateTime,
+    Integer,
+    Numeric,
+    String,
+    bindparam,
+    cast,
+    literal,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from core.database.models import Budget, Goal, PurchaseDecision
@@ -19,6 +35,114 @@ from core.models.context import (
     RecentDecisionContext,
     UserFinancialContext,
 )
+from core.models.money import from_cents, to_cents
+from core.services.user_cache import UserCache
+
+# Budget, goals and recent decisions are fetched in one round trip as a
+# UNION ALL over a shared set of typed column slots, tagged with a "kind"
+# discriminator. Slots a branch doesn't use are CAST NULLs: a bare NULL in a
+# subquery resolves to text on PostgreSQL and can't be unioned with the
+# typed columns of the other branches.
+_CONTEXT_SLOTS = {
+    "id": PG_UUID(as_uuid=True),
+    "name": String(),
+    "amount": Numeric(10, 2),
+    "amount_2": Numeric(10, 2),
+    "date_1": Date(),
+    "date_2": Date(),
+    "categories": JSON(),
+    "text_1": String(),
+    "text_2": String(),
+    "int_1": Integer(),
+    "int_2": Integer(),
+    "flag": Boolean(),
+    "created_at": DateTime(),
+}
+
+
+def _context_columns(kind: str, **columns) -> list:
+    """Project one UNION ALL branch onto the shared context slots."""
+    return [literal(kind).label("kind")] + [
+        (columns[name] if name in columns else cast(null(), type_)).label(name)
+        for name, type_ in _CONTEXT_SLOTS.items()
+    ]
+
+
+_budget_rows = (
+    select(
+        *_context_columns(
+            "budget",
+            id=Budget.budget_id,
+            name=Budget.name,
+            amount=Budget.total_monthly,
+            date_1=Budget.period_start,
+            date_2=Budget.period_end,
+            categories=Budget.categories,
+            created_at=Budget.created_at,
+        )
+    )
+    .where(
+        Budget.user_id == bindparam("user_id"),
+        Budget.period_start <= bindparam("today"),
+        Budget.period_end >= bindparam("today"),
+    )
+    .order_by(Budget.created_at.desc())
+    .limit(1)
+    .subquery()
+)
+_goal_rows = select(
+    *_context_columns(
+        "goal",
+        id=Goal.goal_id,
+        name=Goal.goal_name,
+        amount=Goal.target_amount,
+        amount_2=Goal.current_amount,
+        date_1=Goal.deadline,
+        text_1=Goal.priority,
+        created_at=Goal.created_at,
+    )
+).where(Goal.user_id == bindparam("user_id"), Goal.is_completed == False)
+_decision_rows = (
+    select(
+        *_context_columns(
+            "decision",
+            id=PurchaseDecision.decision_id,
+            name=PurchaseDecision.item_name,
+            amount=PurchaseDecision.amount,
+            text_1=PurchaseDecision.category,
+            text_2=PurchaseDecision.decision_category,
+            int_1=PurchaseDecision.score,
+            int_2=PurchaseDecision.regret_level,
+            flag=PurchaseDecision.actual_purchase,
+            created_at=PurchaseDecision.created_at,
+        )
+    )
+    .where(
+        PurchaseDecision.user_id == bindparam("user_id"),
+        PurchaseDecision.created_at > bindparam("cutoff"),
+    )
+    .order_by(PurchaseDecision.created_at.desc())
+    .limit(20)
+    .subquery()
+)
+_context_rows = union_all(
+    select(_budget_rows), _goal_rows, select(_decision_rows)
+).order_by(_goal_rows.selected_columns.created_at.desc())
+
+
+# Recently built contexts per user. Entries are dropped when a flush touching
+# the user's budgets, goals or decisions commits; see core.services.user_cache
+# for the limits of that. Callers get copies, never the cached model.
+_context_cache = UserCache(
+    (Budget, Goal, PurchaseDecision),
+    "context_cache_ttl_seconds",
+    "context_cache_size",
+)
+
+
+def invalidate_context(user_id: UUID) -> None:
+    """Drop the cached financial context for a user."""
+    _context_cache.invalidate(user_id)
 
 
 class ContextBuilder:
@@ -27,17 +151,63 @@ class ContextBuilder:
     def __init__(self, db: Session):
         self.db = db
 
-    def build_context(self, user_id: UUID) -> UserFinancialContext:
+    def get_context(
+        self, user_id: UUID, now: Optional[datetime] = None
+    ) -> UserFinancialContext:
+        """Return a recently built context for a user, building it on a miss.
+
+        Args:
+            user_id: User ID
+            now: Reference time (UTC) used if the context has to be built
+
+        Returns:
+            A copy of the cached context, free for the caller to modify
+        """
+        context = _context_cache.get(
+            user_id, "context", lambda: self.build_context(user_id, now=now)
+        )
+        return context.model_copy(deep=True)
+
+    def build_context(
+        self, user_id: UUID, now: Optional[datetime] = None
+    ) -> UserFinancialContext:
         """Build complete financial context for a user.
 
         Uses standardized queries: budget must span today,
         goals must be active, decisions within last 30 days.
+        All three are read with a single statement.
+
+        Args:
+            user_id: User ID
+            now: Reference time (UTC) shared by the whole request; defaults
+                to the current time
         """
-        budget_ctx = self._build_budget_context(user_id)
-        goals_ctx = self._build_goals_context(user_id)
-        decisions_ctx = self._build_decisions_context(user_id)
+        if now is None:
+            now = datetime.utcnow()
+
+        budget_ctx: Optional[ActiveBudgetContext] = None
+        goals_ctx: list[GoalContext] = []
+        decisions_ctx: list[RecentDecisionContext] = []
+
+        rows = self.db.execute(
+            _context_rows,
+            {
+                "user_id": user_id,
+                "today": now.date(),
+                "cutoff": now - timedelta(days=30),
+            },
+        )
+        # Rows come back already typed by the slot columns, so the context
+        # models are built with model_construct rather than re-validated
+        for row in rows:
+            if row.kind == "decision":
+                decisions_ctx.append(self._build_decision_context(row))
+            elif row.kind == "goal":
+                goals_ctx.append(self._build_goal_context(row))
+            else:
+                budget_ctx = self._build_budget_context(row)
 
-        return UserFinancialContext(
+        return UserFinancialContext.model_construct(
             user_id=user_id,
             active_budget=budget_ctx,
             active_goals=goals_ctx,
@@ -46,118 +216,72 @@ class ContextBuilder:
             has_goals=len(goals_ctx) > 0,
         )
 
-    def _build_budget_context(self, user_id: UUID) -> Optional[ActiveBudgetContext]:
-        """Build active budget context.
-
-        Standardized query: period_start <= today AND period_end >= today.
-        """
-        today = date.today()
-        budget = (
-            self.db.query(Budget)
-            .filter(
-                Budget.user_id == user_id,
-                Budget.period_start <= today,
-                Budget.period_end >= today,
-            )
-            .order_by(Budget.created_at.desc())
-            .first()
-        )
-
-        if not budget:
-            return None
-
+    def _build_budget_context(self, row: Row) -> ActiveBudgetContext:
+        """Build active budget context from a "budget" row."""
+        # Category amounts arrive from JSON as floats; sum and compare them as
+        # integer cents and build each Decimal once from the exact cents value
         categories = {}
-        total_spent = Decimal("0")
-        total_limit = Decimal("0")
+        total_spent = 0
+        total_limit = 0
 
-        for cat_name, details in budget.categories.items():
-            limit = Decimal(str(details.get("limit", 0)))
-            spent = Decimal(str(details.get("spent", 0)))
-            remaining = limit - spent
-            pct = float((spent / limit * 100) if limit > 0 else 0)
+        for cat_name, details in row.categories.items():
+            limit = to_cents(details.get("limit", 0))
+            spent = to_cents(details.get("spent", 0))
 
-            categories[cat_name] = BudgetCategoryContext(
+            categories[cat_name] = BudgetCategoryContext.model_construct(
                 name=cat_name,
-                limit=limit,
-                spent=spent,
-                remaining=remaining,
-                percentage_used=pct,
+                limit=from_cents(limit),
+                spent=from_cents(spent),
+                remaining=from_cents(limit - spent),
+                percentage_used=(spent / limit * 100) if limit > 0 else 0.0,
             )
             total_spent += spent
             total_limit += limit
 
-        total_remaining = total_limit - total_spent
-        total_pct = float((total_spent / total_limit * 100) if total_limit > 0 else 0)
+        total_pct = (total_spent / total_limit * 100) if total_limit > 0 else 0.0
 
-        return ActiveBudgetContext(
-            budget_id=budget.budget_id,
-            name=budget.name,
-            total_monthly=budget.total_monthly,
-            period_start=budget.period_start,
-            period_end=budget.period_end,
+        return ActiveBudgetContext.model_construct(
+            budget_id=row.id,
+            name=row.name,
+            total_monthly=row.amount,
+            period_start=row.date_1,
+            period_end=row.date_2,
             categories=categories,
-            total_spent=total_spent,
-            total_limit=total_limit,
-            total_remaining=total_remaining,
+            total_spent=from_cents(total_spent),
+            total_limit=from_cents(total_limit),
+            total_remaining=from_cents(total_limit - total_spent),
             percentage_used=total_pct,
         )
 
-    def _build_goals_context(self, user_id: UUID) -> list[GoalContext]:
-        """Build active goals context."""
-        goals = (
-            self.db.query(Goal)
-            .filter(Goal.user_id == user_id, Goal.is_completed == False)
-            .order_by(Goal.created_at.desc())
-            .all()
-        )
-
-        result = []
-        for goal in goals:
-            target = Decimal(str(goal.target_amount))
-            current = Decimal(str(goal.current_amount))
-            remaining = target - current
-            pct = float((current / target * 100) if target > 0 else 0)
-
-            result.append(
-                GoalContext(
-                    goal_id=goal.goal_id,
-                    goal_name=goal.goal_name,
-                    target_amount=target,
-                    current_amount=current,
-                    remaining=remaining,
-                    percentage_complete=pct,
-                    priority=goal.priority,
-                    deadline=goal.deadline,
-                )
-            )
-        return result
+    def _build_goal_context(self, row: Row) -> GoalContext:
+        """Build context for one active goal from a "goal" row."""
+        # Numeric columns already load as Decimal
+        target = row.amount
+        current = row.amount_2
+        remaining = target - current
+        pct = float((current / target * 100) if target > 0 else 0)
 
-    def _build_decisions_context(self, user_id: UUID) -> list[RecentDecisionContext]:
-        """Build recent decisions context (last 30 days)."""
-        cutoff = datetime.utcnow() - timedelta(days=30)
-
-        decisions = (
-            self.db.query(PurchaseDecision)
-            .filter(
-                PurchaseDecision.user_id == user_id,
-                PurchaseDecision.created_at > cutoff,
-            )
-            .order_by(PurchaseDecision.created_at.desc())
-            .limit(20)
-            .all()
+        return GoalContext.model_construct(
+            goal_id=row.id,
+            goal_name=row.name,
+            target_amount=target,
+            current_amount=current,
+            remaining=remaining,
+            percentage_complete=pct,
+            priority=row.text_1,
+            deadline=row.date_1,
         )
 
-        return [
-            RecentDecisionContext(
-                decision_id=d.decision_id,
-                item_name=d.item_name,
-                amount=Decimal(str(d.amount)),
-                category=d.category,
-                score=d.score,
-                decision_category=d.decision_category,
-                actual_purchase=d.actual_purchase,
-                regret_level=d.regret_level,
-                created_at=d.created_at,
-            )
-            for d in decisions
-        ]
+    def _build_decision_context(self, row: Row) -> RecentDecisionContext:
+        """Build context for one recent decision (last 30 days)."""
+        return RecentDecisionContext.model_construct(
+            decision_id=row.id,
+            item_name=row.name,
+            amount=row.amount,
+            category=row.text_1,
+            score=row.int_1,
+            decision_category=row.text_2,
+            actual_purchase=row.flag,
+            regret_level=row.int_2,
+            created_at=row.created_at,
+        )
@@ -4,13 +4,20 @@ This uses a swarm-based architecture where agents hand off control to each other
 providing better error handling, simpler execution, and clearer debugging.
 """
 
+import asyncio
 import os
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from core.ai.agents.conversation_swarm import SwarmOrchestrator
+from core.ai.agents.conversation_swarm import SwarmOrchestrator, is_small_talk
+from core.config import settings
+from core.models.context import UserFinancialContext
 from core.models.conversation import (
     ConversationMessage,
     ConversationRequest,
@@ -18,6 +25,21 @@ from core.models.conversation import (
 )
 from core.services.context_builder import ContextBuilder
 
+# Swarm orchestrators hold each user's conversation state. They live at module
+# level so every ConversationService in this worker (one is built per request)
+# shares them, kept in LRU order and capped so idle users' agents are freed.
+_orchestrators: "OrderedDict[str, SwarmOrchestrator]" = OrderedDict()
+_orchestrators_lock = threading.Lock()
+
+
+def _release(orchestrator: SwarmOrchestrator):
+    """Close an orchestrator dropped from the cache unless it is mid-turn.
+
+    A turn in progress closes its orchestrator itself when it ends.
+    """
+    if not orchestrator.turn_lock.locked():
+        orchestrator.close()
+
 
 class ConversationService:
     """
@@ -39,9 +61,7 @@ class ConversationService:
         """
         self.db = db
         self.context_builder = ContextBuilder(db)
-
-        # Swarm orchestrators are created per-user to maintain conversation state
-        self._user_orchestrators = {}  # user_id -> SwarmOrchestrator
+        self._user_orchestrators = _orchestrators
 
     def _get_or_create_orchestrator(self, user_id: UUID) -> SwarmOrchestrator:
         """Get existing swarm orchestrator for user or create a new one.
@@ -53,11 +73,89 @@ class ConversationService:
             Swarm orchestrator for this user
         """
         user_id_str = str(user_id)
-        if user_id_str not in self._user_orchestrators:
-            self._user_orchestrators[user_id_str] = SwarmOrchestrator(self.db, user_id)
-        return self._user_orchestrators[user_id_str]
+        with _orchestrators_lock:
+            orchestrator = self._user_orchestrators.get(user_id_str)
+            if orchestrator is not None:
+                self._user_orchestrators.move_to_end(user_id_str)
+                return orchestrator
+
+            orchestrator = SwarmOrchestrator(self.db, user_id)
+            self._user_orchestrators[user_id_str] = orchestrator
+            return orchestrator
+
+    def _evict_orchestrators(self):
+        """Release the least recently used orchestrators beyond the cap.
+
+        Called on the event loop, where turn locks are taken, so an
+        orchestrator seen idle here can't start a turn before it is closed.
+        One that is mid-turn is closed by that turn when it ends.
+        """
+        evicted = []
+        with _orchestrators_lock:
+            while (
+                len(self._user_orchestrators) > settings.max_conversation_orchestrators
+            ):
+                evicted.append(self._user_orchestrators.popitem(last=False)[1])
+        for orchestrator in evicted:
+            _release(orchestrator)
+
+    @asynccontextmanager
+    async def _turn(self, orchestrator: SwarmOrchestrator):
+        """Run one turn on a shared orchestrator against this request's session.
+
+        Tools are rebuilt every turn from orchestrator.db, so it is pointed at
+        this request's session only while the orchestrator's turn lock is
+        held. The orchestrator is closed afterwards so neither the session
+        nor the turn's agents outlive the request.
+
+        Args:
+            orchestrator: Swarm orchestrator for this user
+
+        Yields:
+            The orchestrator, bound to this request's session
+        """
+        async with orchestrator.turn_lock:
+            orchestrator.db = self.db
+            try:
+                yield orchestrator
+            finally:
+                orchestrator.close()
+
+    async def _prepare(
+        self, user_id: UUID, message: str
+    ) -> Tuple[Optional[UserFinancialContext], SwarmOrchestrator]:
+        """Get the financial context and swarm orchestrator for a turn.
+
+        The context (reused from a recent turn, or built once against a
+        single clock read) is fetched while the orchestrator is fetched or
+        created, both off the event loop. Only the context lookup touches
+        the session until both are done. Bare greetings never consult the
+        context, so it isn't fetched for them.
+
+        Args:
+            user_id: User ID
+            message: User's message
 
-    def handle_message(
+        Returns:
+            Financial context (None for small talk) and swarm orchestrator
+            for this user
+        """
+        if is_small_talk(message):
+            financial_context = None
+            orchestrator = await asyncio.to_thread(
+                self._get_or_create_orchestrator, user_id
+            )
+        else:
+            financial_context, orchestrator = await asyncio.gather(
+                asyncio.to_thread(
+                    self.context_builder.get_context, user_id, now=datetime.utcnow()
+                ),
+                asyncio.to_thread(self._get_or_create_orchestrator, user_id),
+            )
+        self._evict_orchestrators()
+        return financial_context, orchestrator
+
+    async def handle_message(
         self, user_id: UUID, request: ConversationRequest
     ) -> ConversationResponse:
         """Process a conversational message through the agent swarm.
@@ -69,20 +167,20 @@ class ConversationService:
         Returns:
             Conversation response
         """
-        # Build financial context once
-        financial_context = self.context_builder.build_context(user_id)
-
-        # Get or create swarm orchestrator for this user
-        orchestrator = self._get_or_create_orchestrator(user_id)
+        financial_context, orchestrator = await self._prepare(user_id, request.message)
 
-        # Process message through swarm
-        response_text = orchestrator.process_message(
-            user_message=request.message,
-            conversation_history=request.conversation_history,
-            financial_context=financial_context,
-        )
+        # Process message through swarm; the blocking model calls run in a
+        # worker thread so the event loop keeps serving other requests
+        async with self._turn(orchestrator):
+            response_text = await asyncio.to_thread(
+                orchestrator.process_message,
+                user_message=request.message,
+                conversation_history=request.conversation_history,
+                financial_context=financial_context,
+            )
 
-        return ConversationResponse(message=response_text)
+        # process_message always returns a str, so skip re-validating it
+        return ConversationResponse.model_construct(message=response_text)
 
     async def stream_handle_message(self, user_id: UUID, request: ConversationRequest):
         """Stream conversational message through the agent swarm.
@@ -94,19 +192,16 @@ class ConversationService:
         Yields:
             Response chunks
         """
-        # Build financial context once
-        financial_context = self.context_builder.build_context(user_id)
-
-        # Get or create swarm orchestrator for this user
-        orchestrator = self._get_or_create_orchestrator(user_id)
+        financial_context, orchestrator = await self._prepare(user_id, request.message)
 
         # Stream message through swarm
-        async for chunk in orchestrator.stream_message(
-            user_message=request.message,
-            conversation_history=request.conversation_history,
-            financial_context=financial_context,
-        ):
-            yield chunk
+        async with self._turn(orchestrator):
+            async for chunk in orchestrator.stream_message(
+                user_message=request.message,
+                conversation_history=request.conversation_history,
+                financial_context=financial_context,
+            ):
+                yield chunk
 
     def reset_conversation(self, user_id: UUID):
         """Reset conversation state for a user (start fresh).
@@ -114,6 +209,7 @@ class ConversationService:
         Args:
             user_id: User ID
         """
-        user_id_str = str(user_id)
-        if user_id_str in self._user_orchestrators:
-            del self._user_orchestrators[user_id_str]
+        with _orchestrators_lock:
+            orchestrator = self._user_orchestrators.pop(str(user_id), None)
+        if orchestrator is not None:
+            _release(orchestrator)
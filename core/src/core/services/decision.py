@@ -1,13 +1,18 @@
 """Service layer for purchase decisions."""
 
-from datetime import datetime
+import asyncio
+import base64
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Callable, List, Optional
 from uuid import UUID, uuid4
 
+from pydantic_core import from_json, to_json
+from sqlalchemy import and_, case, func, tuple_
 from sqlalchemy.orm import Session
 
 from core.ai.agents.decision_agent import DecisionAgent
+from core.config import settings
 from core.database.models import Budget
 from core.database.models import PurchaseDecision as PurchaseDecisionDB
 from core.models.budget import BudgetItemCreate
@@ -21,6 +26,7 @@ from core.models.context import UserFinancialContext
 from core.models.decision import (
     BudgetCategory,
     DecisionFeedback,
+    PurchaseDecision,
     PurchaseDecisionListResponse,
     PurchaseDecisionRequest,
     PurchaseDecisionResponse,
@@ -29,6 +35,64 @@ from core.models.decision import (
     PurchaseDecisionDB as PurchaseDecisionDBModel,
 )
 from core.services.budget import BudgetService
+from core.services.context_builder import ContextBuilder
+from core.services.user_cache import UserCache
+
+# Cart summary wording by overall score band, filled with the cart total
+_RECONSIDER_TEMPLATE = "We recommend reconsidering this ${:.2f} purchase. "
+_ALIGNED_TEMPLATE = "This ${:.2f} purchase aligns with your financial goals. "
+_MIXED_TEMPLATE = "This ${:.2f} purchase has mixed financial impact. "
+
+# SQL mirror of DecisionService._calculate_behavioral_score so stats can be
+# averaged in the database; keep the two in step
+_SCORE = PurchaseDecisionDB.score
+_BOUGHT = PurchaseDecisionDB.actual_purchase
+_REGRET = PurchaseDecisionDB.regret_level
+_SKIPPED_GOOD_SCORE = 8.0 - _SCORE * 0.4
+_REGRETTED_SCORE = 4.0 - (_REGRET - 7) * 1.0
+_BEHAVIORAL_SCORE = case(
+    (_BOUGHT.is_(None), _SCORE),
+    (_BOUGHT.is_(False) & (_SCORE <= 5), 9.0 - (_SCORE - 1) * 0.5),
+    (
+        _BOUGHT.is_(False) & (_SCORE >= 7),
+        case((_SKIPPED_GOOD_SCORE < 4.0, 4.0), else_=_SKIPPED_GOOD_SCORE),
+    ),
+    (_BOUGHT.is_(False), 6.0),
+    (_REGRET >= 7, case((_REGRETTED_SCORE < 1.0, 1.0), else_=_REGRETTED_SCORE)),
+    ((_REGRET <= 3) & (_SCORE >= 7), _SCORE),
+    (_REGRET <= 3, 6.0),
+    else_=_SCORE,
+)
+
+
+# Stats and dashboard summaries per user, cached as encoded JSON so callers
+# never share a mutable result. Entries are dropped when a flush touching the
+# user's decisions or budgets commits; see core.services.user_cache for the
+# limits of that.
+_stats_cache = UserCache(
+    (Budget, PurchaseDecisionDB), "stats_cache_ttl_seconds", "stats_cache_size"
+)
+
+
+def invalidate_stats(user_id: UUID) -> None:
+    """Drop the cached decision stats and dashboard summary for a user."""
+    _stats_cache.invalidate(user_id)
+
+
+def _encode_cursor(created_at: datetime, decision_id: UUID) -> str:
+    """Encode a list position as an opaque keyset cursor."""
+    raw = f"{created_at.isoformat()}|{decision_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a keyset cursor back into (created_at, decision_id)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, decision_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(decision_id)
+    except ValueError:
+        raise ValueError("Invalid cursor") from None
 
 
 class DecisionService:
@@ -81,7 +145,10 @@ class DecisionService:
         # Save to database as a new decision
         # Use mode='json' to properly serialize Decimal fields
         # After analyze_purchase, request should have all fields populated (from extraction or original)
+        # Assign the id up front so nothing has to be read back after commit
+        decision_id = uuid4()
         db_decision = PurchaseDecisionDB(
+            decision_id=decision_id,
             user_id=user_id,
             item_name=request.item_name
             or "Unknown Item",  # Fallback in case extraction failed
@@ -101,11 +168,8 @@ class DecisionService:
 
         self.db.add(db_decision)
         self.db.commit()
-        self.db.refresh(db_decision)
 
-        return PurchaseDecisionResponse(
-            decision=decision, decision_id=db_decision.decision_id
-        )
+        return PurchaseDecisionResponse(decision=decision, decision_id=decision_id)
 
     def get_decision(
         self, user_id: UUID, decision_id: UUID
@@ -131,7 +195,7 @@ class DecisionService:
         if not decision:
             return None
 
-        return PurchaseDecisionDBModel.model_validate(decision)
+        return PurchaseDecisionDBModel.from_orm_trusted(decision)
 
     def list_decisions(
         self,
@@ -140,18 +204,24 @@ class DecisionService:
         offset: int = 0,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
     ) -> PurchaseDecisionListResponse:
         """List user's decisions.
 
         Args:
             user_id: User ID
             limit: Maximum number of decisions to return
-            offset: Number of decisions to skip
+            offset: Number of decisions to skip (ignored when cursor is given)
             start_date: Optional start date for filtering
             end_date: Optional end date for filtering
+            cursor: Optional next_cursor from a previous page; seeks straight
+                to the next page instead of scanning past offset rows
 
         Returns:
             Paginated list of decisions
+
+        Raises:
+            ValueError: If cursor is malformed
         """
         query = self.db.query(PurchaseDecisionDB).filter(
             PurchaseDecisionDB.user_id == user_id
@@ -163,23 +233,61 @@ class DecisionService:
         if end_date:
             query = query.filter(PurchaseDecisionDB.created_at <= end_date)
 
-        # Get total count
-        total = query.count()
-
-        decisions = (
-            query.order_by(PurchaseDecisionDB.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-            .all()
+        # decision_id breaks created_at ties so keyset pages never overlap
+        order = (
+            PurchaseDecisionDB.created_at.desc(),
+            PurchaseDecisionDB.decision_id.desc(),
         )
 
-        items = [PurchaseDecisionDBModel.model_validate(d) for d in decisions]
+        if cursor:
+            cursor_created_at, cursor_id = _decode_cursor(cursor)
+            # A window count would only see rows past the cursor
+            total = query.count()
+            decisions = (
+                query.filter(
+                    tuple_(
+                        PurchaseDecisionDB.created_at, PurchaseDecisionDB.decision_id
+                    )
+                    < tuple_(cursor_created_at, cursor_id)
+                )
+                .order_by(*order)
+                .limit(limit)
+                .all()
+            )
+        else:
+            # The total rides along on every row as a window count, so the
+            # page and the count come back from one statement
+            rows = (
+                query.add_columns(func.count().over().label("total"))
+                .order_by(*order)
+                .limit(limit)
+                .offset(offset)
+                .all()
+            )
+
+            if rows:
+                total = rows[0].total
+            elif offset:
+                # Paged past the end: no rows left to carry the window count
+                total = query.count()
+            else:
+                total = 0
+            decisions = [d for d, _ in rows]
+
+        items = [PurchaseDecisionDBModel.from_orm_trusted(d) for d in decisions]
+
+        # A full page may have more behind it
+        next_cursor = None
+        if decisions and len(decisions) == limit:
+            last = decisions[-1]
+            next_cursor = _encode_cursor(last.created_at, last.decision_id)
 
         return PurchaseDecisionListResponse(
             items=items,
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=next_cursor,
         )
 
     def add_feedback(
@@ -198,63 +306,64 @@ class DecisionService:
         Returns:
             Updated decision if found, None otherwise
         """
-        decision = (
-            self.db.query(PurchaseDecisionDB)
+        # Fetch the decision and the user's active budget in one round trip,
+        # before any attribute is touched so nothing is autoflushed
+        now = datetime.utcnow()
+        today = now.date()
+        row = (
+            self.db.query(PurchaseDecisionDB, Budget)
+            .outerjoin(
+                Budget,
+                and_(
+                    Budget.user_id == PurchaseDecisionDB.user_id,
+                    Budget.period_start <= today,
+                    Budget.period_end >= today,
+                ),
+            )
             .filter(
                 PurchaseDecisionDB.decision_id == decision_id,
                 PurchaseDecisionDB.user_id == user_id,
             )
+            .order_by(Budget.created_at.desc())
             .first()
         )
 
-        if not decision:
+        if row is None:
             return None
 
-        # Query budget BEFORE modifying decision to avoid autoflush on dirty object
-        active_budget = None
-        if feedback.actual_purchase and decision.category:
-            active_budget = (
-                self.db.query(Budget)
-                .filter(
-                    Budget.user_id == user_id,
-                    Budget.period_start <= datetime.utcnow().date(),
-                    Budget.period_end >= datetime.utcnow().date(),
-                )
-                .first()
-            )
-
-        # Update feedback fields
-        decision.actual_purchase = feedback.actual_purchase
-        decision.regret_level = feedback.regret_level
-        if feedback.feedback is not None:
-            decision.user_feedback = feedback.feedback
-
-        # If user actually made the purchase, record it as a budget item
-        if feedback.actual_purchase and decision.category:
-            if active_budget and decision.category in active_budget.categories:
-                # Create budget item to track this purchase
-                budget_item_data = BudgetItemCreate(
-                    item_name=decision.item_name,
-                    amount=Decimal(str(decision.amount)),
-                    category=decision.category,
-                    transaction_date=datetime.utcnow(),
-                    decision_id=decision_id,
-                    notes=feedback.feedback,
-                    is_planned=decision.score
-                    >= 7,  # Consider it planned if AI recommended it
-                )
-
-                # Add to budget and update spending
-                self.budget_service.add_budget_item(
-                    budget_id=active_budget.budget_id,
-                    user_id=user_id,
-                    item_data=budget_item_data,
-                )
-
-        self.db.commit()
-        self.db.refresh(decision)
-
-        return PurchaseDecisionDBModel.model_validate(decision)
+        decision, active_budget = row
+
+        # The feedback and any budget item commit together, or not at all
+        with self.budget_service.transaction():
+            # Update feedback fields
+            decision.actual_purchase = feedback.actual_purchase
+            decision.regret_level = feedback.regret_level
+            if feedback.feedback is not None:
+                decision.user_feedback = feedback.feedback
+
+            # If user actually made the purchase, record it as a budget item
+            if feedback.actual_purchase and decision.category:
+                if active_budget and decision.category in active_budget.categories:
+                    # Create budget item to track this purchase
+                    budget_item_data = BudgetItemCreate(
+                        item_name=decision.item_name,
+                        amount=Decimal(str(decision.amount)),
+                        category=decision.category,
+                        transaction_date=now,
+                        decision_id=decision_id,
+                        notes=feedback.feedback,
+                        is_planned=decision.score
+                        >= 7,  # Consider it planned if AI recommended it
+                    )
+
+                    # Add to budget and update spending
+                    self.budget_service.add_budget_item(
+                        budget_id=active_budget.budget_id,
+                        user_id=user_id,
+                        item_data=budget_item_data,
+                    )
+
+        return PurchaseDecisionDBModel.from_orm_trusted(decision)
 
     @staticmethod
     def _calculate_behavioral_score(decision) -> float:
@@ -301,8 +410,25 @@ class DecisionService:
                 # Moderate regret or no regret data — keep AI score
                 return float(ai_score)
 
+    def _cached_stats(
+        self, kind: str, user_id: UUID, build: Callable[[UUID], dict]
+    ) -> bytes:
+        """Return a recent JSON encoding of build(user_id), building it on a miss."""
+        return _stats_cache.get(user_id, kind, lambda: to_json(build(user_id)))
+
+    def get_decision_stats_json(self, user_id: UUID) -> bytes:
+        """Get decision statistics for a user as JSON, reusing a recent result.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            JSON-encoded decision statistics
+        """
+        return self._cached_stats("stats", user_id, self._build_decision_stats)
+
     def get_decision_stats(self, user_id: UUID) -> dict:
-        """Get decision statistics for a user.
+        """Get decision statistics for a user, reusing a recent result.
 
         Args:
             user_id: User ID
@@ -310,16 +436,51 @@ class DecisionService:
         Returns:
             Dictionary with decision statistics including growth insights
         """
-        from datetime import datetime, timedelta
+        return from_json(self.get_decision_stats_json(user_id))
 
-        all_decisions = (
-            self.db.query(PurchaseDecisionDB)
-            .filter(PurchaseDecisionDB.user_id == user_id)
-            .order_by(PurchaseDecisionDB.created_at.asc())
-            .all()
+    def _build_decision_stats(self, user_id: UUID) -> dict:
+        """Compute decision statistics for a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Dictionary with decision statistics including growth insights
+        """
+        # Impulse control growth compares the last 30 days with the 30 before
+        now = datetime.utcnow()
+        thirty_days_ago = now - timedelta(days=30)
+        sixty_days_ago = now - timedelta(days=60)
+
+        # AI said "no" (score <= 5) and the user didn't buy
+        intercepted = (_SCORE <= 5) & _BOUGHT.is_(False)
+        recent = PurchaseDecisionDB.created_at >= thirty_days_ago
+        previous = (PurchaseDecisionDB.created_at >= sixty_days_ago) & (
+            PurchaseDecisionDB.created_at < thirty_days_ago
+        )
+        for_user = PurchaseDecisionDB.user_id == user_id
+
+        totals = (
+            self.db.query(
+                func.count().label("total"),
+                func.avg(_BEHAVIORAL_SCORE).label("average_score"),
+                func.sum(PurchaseDecisionDB.amount).label("total_requested"),
+                func.count(_BOUGHT).label("with_feedback"),
+                func.sum(PurchaseDecisionDB.amount)
+                .filter(intercepted)
+                .label("capital_retained"),
+                func.count().filter(intercepted).label("intercepted_count"),
+                func.avg(_BEHAVIORAL_SCORE).filter(recent).label("recent_average"),
+                func.avg(_BEHAVIORAL_SCORE)
+                .filter(previous)
+                .label("previous_average"),
+            )
+            .select_from(PurchaseDecisionDB)
+            .filter(for_user)
+            .one()
         )
 
-        if not all_decisions:
+        if not totals.total:
             return {
                 "total_decisions": 0,
                 "average_score": 0.0,
@@ -332,52 +493,25 @@ class DecisionService:
                 "weekly_scores": [],
             }
 
-        total = len(all_decisions)
-        avg_score = (
-            sum(self._calculate_behavioral_score(d) for d in all_decisions) / total
-        )
-        total_requested = sum(float(d.amount) for d in all_decisions)
+        total = totals.total
+        avg_score = float(totals.average_score)
+        total_requested = float(totals.total_requested)
+        feedback_rate = totals.with_feedback / total * 100
+        capital_retained = float(totals.capital_retained or 0)
+        intercepted_count = totals.intercepted_count
 
         # Count by decision category
-        category_counts = {}
-        for d in all_decisions:
-            cat = d.decision_category
-            category_counts[cat] = category_counts.get(cat, 0) + 1
-
-        # Calculate feedback rate
-        with_feedback = sum(1 for d in all_decisions if d.actual_purchase is not None)
-        feedback_rate = (with_feedback / total * 100) if total > 0 else 0
-
-        # Calculate capital retained (AI recommended "no" and user didn't buy)
-        capital_retained = 0.0
-        intercepted_count = 0
-
-        for d in all_decisions:
-            # AI said "no" (score <= 5) or "mild no" (score 4-5)
-            ai_recommended_no = d.score <= 5
-            user_didnt_buy = d.actual_purchase == False
-
-            if ai_recommended_no and user_didnt_buy:
-                capital_retained += float(d.amount)
-                intercepted_count += 1
-
-        # Calculate impulse control growth (last 30 days vs previous 30 days)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        sixty_days_ago = datetime.utcnow() - timedelta(days=60)
-
-        recent_decisions = [d for d in all_decisions if d.created_at >= thirty_days_ago]
-        previous_decisions = [
-            d for d in all_decisions if sixty_days_ago <= d.created_at < thirty_days_ago
-        ]
+        category_counts = dict(
+            self.db.query(PurchaseDecisionDB.decision_category, func.count())
+            .filter(for_user)
+            .group_by(PurchaseDecisionDB.decision_category)
+            .all()
+        )
 
         impulse_control_growth = 0.0
-        if recent_decisions and previous_decisions:
-            recent_avg = sum(
-                self._calculate_behavioral_score(d) for d in recent_decisions
-            ) / len(recent_decisions)
-            previous_avg = sum(
-                self._calculate_behavioral_score(d) for d in previous_decisions
-            ) / len(previous_decisions)
+        if totals.recent_average is not None and totals.previous_average is not None:
+            recent_avg = float(totals.recent_average)
+            previous_avg = float(totals.previous_average)
 
             if previous_avg > 0:
                 impulse_control_growth = (
@@ -386,9 +520,19 @@ class DecisionService:
 
         # Calculate decision score trend (individual decisions with feedback only)
         # Only include decisions where user provided feedback (actual_purchase is not None)
-        decisions_with_feedback = [
-            d for d in all_decisions if d.actual_purchase is not None
-        ]
+        decisions_with_feedback = (
+            self.db.query(
+                _SCORE,
+                _BOUGHT,
+                _REGRET,
+                PurchaseDecisionDB.item_name,
+                PurchaseDecisionDB.created_at,
+                PurchaseDecisionDB.amount,
+            )
+            .filter(for_user, _BOUGHT.isnot(None))
+            .order_by(PurchaseDecisionDB.created_at.asc())
+            .all()
+        )
 
         # Get chronological behavioral scores (scaled to 0-100) for decisions with feedback
         weekly_scores = [
@@ -421,7 +565,22 @@ class DecisionService:
         }
 
     def get_dashboard_summary(self, user_id: UUID) -> dict:
-        """Get summary data for the dashboard.
+        """Get summary data for the dashboard, reusing a recent result.
+
+        The result is decoded from cached JSON, so IDs come back as strings.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Dictionary containing guard score, trend, and recent decisions.
+        """
+        return from_json(
+            self._cached_stats("dashboard", user_id, self._build_dashboard_summary)
+        )
+
+    def _build_dashboard_summary(self, user_id: UUID) -> dict:
+        """Compute summary data for the dashboard.
 
         The guard score is now calculated using:
         1. Recent decision scores (60% weight)
@@ -433,10 +592,22 @@ class DecisionService:
         Returns:
             Dictionary containing guard score, trend, and recent decisions.
         """
-        # Get recent decisions to calculate performance
+        for_user = PurchaseDecisionDB.user_id == user_id
+
+        # Get recent decisions to calculate performance; only the columns the
+        # score and the recent decision cards read
         recent_decisions = (
-            self.db.query(PurchaseDecisionDB)
-            .filter(PurchaseDecisionDB.user_id == user_id)
+            self.db.query(
+                PurchaseDecisionDB.decision_id,
+                PurchaseDecisionDB.item_name,
+                PurchaseDecisionDB.amount,
+                PurchaseDecisionDB.category,
+                PurchaseDecisionDB.created_at,
+                _SCORE,
+                _BOUGHT,
+                _REGRET,
+            )
+            .filter(for_user)
             .order_by(PurchaseDecisionDB.created_at.desc())
             .limit(20)
             .all()
@@ -478,10 +649,21 @@ class DecisionService:
 
         # Trend data (reverse to chronological order for sparkline)
         # Only include decisions with feedback (actual_purchase is not None)
-        # Limit to last 7 decisions with feedback for the graph
-        decisions_with_feedback = [
-            d for d in recent_decisions if d.actual_purchase is not None
-        ][:7]  # Take only the first 7 (most recent)
+        # Limit to last 7 decisions with feedback for the graph, however far
+        # back they go
+        decisions_with_feedback = (
+            self.db.query(
+                _SCORE,
+                _BOUGHT,
+                _REGRET,
+                PurchaseDecisionDB.item_name,
+                PurchaseDecisionDB.created_at,
+            )
+            .filter(for_user, _BOUGHT.isnot(None))
+            .order_by(PurchaseDecisionDB.created_at.desc())
+            .limit(7)
+            .all()
+        )
 
         trend = [
             {
@@ -548,7 +730,12 @@ class DecisionService:
         # Create agent for cart analysis
         agent = DecisionAgent(self.db)
 
-        # Analyze each item individually
+        # Prefetch budget, goals and recent decisions once for the whole cart
+        # so each item's tools read from memory instead of re-querying them.
+        financial_context = ContextBuilder(self.db).build_context(user_id)
+
+        # Build one decision request per item
+        requests: list[PurchaseDecisionRequest] = []
         for item in items:
             # Calculate total amount for this item
             total_amount = item.price * item.quantity
@@ -556,27 +743,51 @@ class DecisionService:
             # Infer category from item name
             category = self._infer_category(item.item_name)
 
-            # Create decision request
-            decision_request = PurchaseDecisionRequest(
-                item_name=item.item_name,
-                amount=total_amount,
-                category=category,
-                urgency=item.urgency_badge or "normal",
-                reason=f"Cart item from {page_url}",
-                user_message=None,
+            # Create decision request. Every field comes from an already
+            # validated CartItem (price and quantity are > 0) or the
+            # BudgetCategory enum, so validation is skipped.
+            requests.append(
+                PurchaseDecisionRequest.model_construct(
+                    item_name=item.item_name,
+                    amount=total_amount,
+                    category=category,
+                    urgency=item.urgency_badge or "normal",
+                    reason=f"Cart item from {page_url}",
+                    user_message=None,
+                )
             )
 
-            # Analyze item using decision agent
-            decision = agent.analyze_purchase(user_id, decision_request)
+        # Items are independent, so their agent runs overlap in worker
+        # threads. A Session can't be shared across threads, so each run
+        # reads through its own; all writes stay on self.db below.
+        bind = self.db.get_bind()
+        semaphore = asyncio.Semaphore(settings.cart_analysis_concurrency)
 
+        def analyze(request: PurchaseDecisionRequest) -> PurchaseDecision:
+            with Session(bind=bind, expire_on_commit=False) as session:
+                return agent.analyze_purchase(
+                    user_id, request, financial_context, db_session=session
+                )
+
+        async def analyze_limited(
+            request: PurchaseDecisionRequest,
+        ) -> PurchaseDecision:
+            async with semaphore:
+                return await asyncio.to_thread(analyze, request)
+
+        decisions = await asyncio.gather(
+            *(analyze_limited(request) for request in requests)
+        )
+
+        for item, request, decision in zip(items, requests, decisions):
             # Save decision to database
             db_decision = PurchaseDecisionDB(
                 user_id=user_id,
                 item_name=item.item_name,
-                amount=total_amount,
-                category=category.value,
-                reason=f"Cart item from {page_url}",
-                urgency=item.urgency_badge or "normal",
+                amount=request.amount,
+                category=request.category.value,
+                reason=request.reason,
+                urgency=request.urgency,
                 score=decision.score,
                 decision_category=decision.decision_category.value,
                 reasoning=decision.reasoning,
@@ -587,11 +798,11 @@ class DecisionService:
             self.db.add(db_decision)
 
             item_decisions.append(
-                ItemDecisionResult(
+                ItemDecisionResult.model_construct(
                     item_name=item.item_name,
                     price=item.price,
                     quantity=item.quantity,
-                    total_amount=total_amount,
+                    total_amount=request.amount,
                     urgency_badge=item.urgency_badge,
                     decision=decision,
                 )
@@ -694,46 +905,42 @@ class DecisionService:
         Returns:
             Aggregate recommendation
         """
-        # Calculate total amount
-        total_amount = sum(item.total_amount for item in item_decisions)
-
-        # Calculate weighted average score (weighted by item price)
-        if item_decisions:
-            scores = [item.decision.score for item in item_decisions]
-            weights = [float(item.total_amount) for item in item_decisions]
-            total_weight = sum(weights)
-
-            if total_weight > 0:
-                overall_score = int(
-                    sum(s * w for s, w in zip(scores, weights)) / total_weight
-                )
-            else:
-                overall_score = int(sum(scores) / len(scores))
-        else:
+        # Total amount, price-weighted score sums and item categorization
+        # are gathered in a single pass over the items
+        total_amount = 0
+        score_sum = 0
+        weighted_score_sum = 0.0
+        total_weight = 0.0
+        items_to_remove = []
+        items_to_keep = []
+        for item in item_decisions:
+            score = item.decision.score
+            weight = float(item.total_amount)
+            total_amount += item.total_amount
+            score_sum += score
+            weighted_score_sum += score * weight
+            total_weight += weight
+            if score <= 4:
+                items_to_remove.append(item.item_name)
+            elif score >= 7:
+                items_to_keep.append(item.item_name)
+
+        # Weighted average score (weighted by item price)
+        if not item_decisions:
             overall_score = 5
-
-        # Categorize items
-        items_to_remove = [
-            item.item_name for item in item_decisions if item.decision.score <= 4
-        ]
-
-        items_to_keep = [
-            item.item_name for item in item_decisions if item.decision.score >= 7
-        ]
+        elif total_weight > 0:
+            overall_score = int(weighted_score_sum / total_weight)
+        else:
+            overall_score = int(score_sum / len(item_decisions))
 
         # Generate summary recommendation
         if overall_score <= 4:
-            recommendation = (
-                f"We recommend reconsidering this ${total_amount:.2f} purchase. "
-            )
+            template = _RECONSIDER_TEMPLATE
         elif overall_score >= 7:
-            recommendation = (
-                f"This ${total_amount:.2f} purchase aligns with your financial goals. "
-            )
+            template = _ALIGNED_TEMPLATE
         else:
-            recommendation = (
-                f"This ${total_amount:.2f} purchase has mixed financial impact. "
-            )
+            template = _MIXED_TEMPLATE
+        recommendation = template.format(total_amount)
 
         if items_to_remove:
             recommendation += f"Consider removing: {', '.join(items_to_remove[:3])}. "
@@ -1,6 +1,7 @@
 """Goals management service."""
 
 from datetime import datetime
+from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
@@ -29,7 +30,6 @@ class GoalService:
         )
         self.db.add(goal)
         self.db.commit()
-        self.db.refresh(goal)
         return goal
 
     def get_goal(self, goal_id: UUID, user_id: UUID) -> Optional[Goal]:
@@ -74,7 +74,6 @@ class GoalService:
 
         goal.updated_at = datetime.utcnow()
         self.db.commit()
-        self.db.refresh(goal)
         return goal
 
     def delete_goal(self, goal_id: UUID, user_id: UUID) -> bool:
@@ -91,8 +90,6 @@ class GoalService:
         self, goal_id: UUID, user_id: UUID, amount: float
     ) -> Optional[Goal]:
         """Add progress to a goal."""
-        from decimal import Decimal
-
         goal = self.get_goal(goal_id, user_id)
         if not goal:
             return None
@@ -105,5 +102,4 @@ class GoalService:
 
         goal.updated_at = datetime.utcnow()
         self.db.commit()
-        self.db.refresh(goal)
         return goal
@@ -1,16 +1,18 @@
 """Tests for authentication service."""
 
+import time
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from uuid import uuid4
 
+import jwt
 import pytest
-from jose import jwt
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from core.config import settings
 from core.database.models import Base, User
-from core.services.auth import AuthService
+from core.services.auth import AuthService, reload_jwt_settings
 
 
 @pytest.fixture(scope="function")
@@ -180,6 +182,36 @@ class TestVerifyToken:
 
         assert result is None
 
+    def test_verify_token_cached_token_still_expires(self, auth_service):
+        """Test that a cached verification is rejected once the token expires."""
+        user_id = str(uuid4())
+        expire = datetime.utcnow() + timedelta(minutes=5)
+        to_encode = {"sub": user_id, "exp": expire, "iat": datetime.utcnow()}
+        token = jwt.encode(
+            to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
+        )
+
+        assert auth_service.verify_token(token) == user_id
+
+        with patch("core.services.auth.time.time", return_value=time.time() + 600):
+            assert auth_service.verify_token(token) is None
+
+    def test_verify_token_after_secret_rotation(self, auth_service):
+        """Test tokens signed with a rotated-out secret stop verifying."""
+        user_id = str(uuid4())
+        token = auth_service.create_access_token(user_id)
+        assert auth_service.verify_token(token) == user_id
+
+        try:
+            with patch.object(settings, "jwt_secret_key", "rotated-secret-" + "x" * 32):
+                reload_jwt_settings()
+                assert auth_service.verify_token(token) is None
+
+                new_token = auth_service.create_access_token(user_id)
+                assert auth_service.verify_token(new_token) == user_id
+        finally:
+            reload_jwt_settings()
+
 
 class TestGetOrCreateUser:
     """Tests for user creation from Google OAuth data."""
@@ -211,12 +243,16 @@ class TestGetOrCreateUser:
         assert first_user.email == second_user.email
 
     def test_get_existing_user_updates_info(
-        self, auth_service, sample_google_user_data
+        self, auth_service, db_session, sample_google_user_data
     ):
         """Test that user info is updated on subsequent logins."""
         # Create user first time
         first_user = auth_service.get_or_create_user(sample_google_user_data)
-        original_updated_at = first_user.updated_at
+        # Backdate it: the database stamps updated_at, and SQLite's
+        # CURRENT_TIMESTAMP only has second resolution.
+        original_updated_at = datetime(2000, 1, 1)
+        first_user.updated_at = original_updated_at
+        db_session.commit()
 
         # Update Google data
         updated_google_data = sample_google_user_data.copy()
@@ -2,10 +2,12 @@
 
 from datetime import date, timedelta
 from decimal import Decimal
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session, sessionmaker
 
 from core.database.models import Base, Budget
@@ -388,6 +390,26 @@ class TestUpdateCategorySpending:
 
         assert updated_budget.categories["groceries"]["spent"] == 200.0
 
+    def test_update_category_spending_refreshes_totals(
+        self, budget_service, db_session, user_id, sample_budget_data
+    ):
+        """Test category totals follow every categories write."""
+        budget = budget_service.create_budget(user_id, sample_budget_data)
+        assert budget.total_limit == Decimal("2200.00")
+        assert budget.total_spent == Decimal("0.00")
+
+        budget_service.update_category_spending(
+            budget.budget_id, user_id, "groceries", 150.25
+        )
+        budget_service.update_category_spending(
+            budget.budget_id, user_id, "rent", 1500.00
+        )
+        db_session.expire_all()
+
+        stored = budget_service.get_budget(budget.budget_id, user_id)
+        assert stored.total_limit == Decimal("2200.00")
+        assert stored.total_spent == Decimal("1650.25")
+
     def test_update_category_spending_category_not_found(
         self, budget_service, user_id, sample_budget_data
     ):
@@ -424,3 +446,232 @@ class TestUpdateCategorySpending:
         # Verify spending wasn't changed
         original_budget = budget_service.get_budget(budget.budget_id, user_id)
         assert original_budget.categories["groceries"]["spent"] == 0.0
+
+    def test_bulk_update_category_spending(self, budget_service, user_id):
+        """Test several budgets are updated with one commit."""
+        first = budget_service.create_budget(
+            user_id,
+            BudgetCreate(
+                name="First",
+                total_monthly=Decimal("700.00"),
+                period_start=date.today(),
+                period_end=date.today() + timedelta(days=30),
+                categories={
+                    "groceries": CategoryBudget(limit=Decimal("500.00")),
+                    "dining": CategoryBudget(limit=Decimal("200.00")),
+                },
+            ),
+        )
+        second = budget_service.create_budget(
+            user_id,
+            BudgetCreate(
+                name="Second",
+                total_monthly=Decimal("500.00"),
+                period_start=date.today(),
+                period_end=date.today() + timedelta(days=30),
+                categories={"groceries": CategoryBudget(limit=Decimal("500.00"))},
+            ),
+        )
+
+        with patch.object(
+            budget_service.db, "commit", wraps=budget_service.db.commit
+        ) as commit:
+            updated = budget_service.bulk_update_category_spending(
+                [
+                    (first.budget_id, user_id, "groceries", 100.0),
+                    (first.budget_id, user_id, "dining", 50.0),
+                    (second.budget_id, user_id, "groceries", 300.0),
+                    (first.budget_id, user_id, "groceries", 120.0),
+                    (second.budget_id, uuid4(), "groceries", 999.0),
+                    (second.budget_id, user_id, "nonexistent", 1.0),
+                    (uuid4(), user_id, "groceries", 1.0),
+                ]
+            )
+
+        assert commit.call_count == 1
+        assert {b.budget_id for b in updated} == {first.budget_id, second.budget_id}
+        assert first.categories["groceries"]["spent"] == 120.0
+        assert first.categories["dining"]["spent"] == 50.0
+        assert second.categories["groceries"]["spent"] == 300.0
+        assert "nonexistent" not in second.categories
+
+    def test_bulk_update_category_spending_empty(self, budget_service):
+        """Test an empty batch is a no-op."""
+        assert budget_service.bulk_update_category_spending([]) == []
+
+
+class TestTransaction:
+    """Tests for grouping budget mutations into one transaction."""
+
+    def test_transaction_commits_once(
+        self, budget_service, db_session, user_id, sample_budget_data
+    ):
+        """Test mutations inside transaction() share a single commit."""
+        budget = budget_service.create_budget(user_id, sample_budget_data)
+
+        with patch.object(db_session, "commit", wraps=db_session.commit) as commit_spy:
+            with budget_service.transaction():
+                budget_service.update_category_spending(
+                    budget.budget_id, user_id, "groceries", 100.00
+                )
+                budget_service.update_category_limit(
+                    budget.budget_id, user_id, "groceries", 600.00
+                )
+
+        assert commit_spy.call_count == 1
+        updated = budget_service.get_budget(budget.budget_id, user_id)
+        assert updated.categories["groceries"]["spent"] == 100.0
+        assert updated.categories["groceries"]["limit"] == 600.0
+
+    def test_transaction_rolls_back_on_error(
+        self, budget_service, user_id, sample_budget_data
+    ):
+        """Test a failing block leaves the budget untouched."""
+        budget = budget_service.create_budget(user_id, sample_budget_data)
+        budget_id = budget.budget_id
+
+        with pytest.raises(RuntimeError):
+            with budget_service.transaction():
+                budget_service.add_category(budget_id, user_id, "travel", 300.00)
+                raise RuntimeError("boom")
+
+        reloaded = budget_service.get_budget(budget_id, user_id)
+        assert "travel" not in reloaded.categories
+
+
+class TestAnalyzeBudgetsOverTime:
+    """Tests for multi-period budget analysis."""
+
+    def _create_period(self, budget_service, user_id, month, categories):
+        return budget_service.create_budget(
+            user_id,
+            BudgetCreate(
+                name=f"Month {month}",
+                total_monthly=Decimal("1000.00"),
+                period_start=date(2025, month, 1),
+                period_end=date(2025, month, 28),
+                categories={
+                    name: CategoryBudget(limit=Decimal(limit), spent=Decimal(spent))
+                    for name, (limit, spent) in categories.items()
+                },
+            ),
+        )
+
+    def test_analyze_no_budgets(self, budget_service, user_id):
+        """Test analysis with no budget history."""
+        analysis = budget_service.analyze_budgets_over_time(user_id)
+
+        assert analysis.periods == []
+        assert analysis.average_adherence == 100.0
+        assert analysis.over_budget_count == 0
+
+    def test_analyze_aggregates_periods_and_categories(self, budget_service, user_id):
+        """Test per-period totals and per-category averages."""
+        self._create_period(
+            budget_service,
+            user_id,
+            1,
+            {"groceries": ("500", "600"), "dining": ("200", "100")},
+        )
+        self._create_period(budget_service, user_id, 2, {})
+        self._create_period(budget_service, user_id, 3, {"groceries": ("500", "200")})
+
+        analysis = budget_service.analyze_budgets_over_time(user_id)
+
+        assert [p["name"] for p in analysis.periods] == [
+            "Month 1",
+            "Month 2",
+            "Month 3",
+        ]
+        assert [p["total_spent"] for p in analysis.periods] == [700.0, 0.0, 200.0]
+        assert [p["over_budget_categories"] for p in analysis.periods] == [1, 0, 0]
+        assert analysis.over_budget_count == 1
+        assert analysis.average_adherence == 70.0
+
+        groceries = analysis.category_insights["groceries"]
+        assert groceries["average_spent"] == 400.0
+        assert groceries["average_limit"] == 500.0
+        assert groceries["average_utilization"] == 80.0
+        assert groceries["periods_tracked"] == 2
+        assert analysis.category_insights["dining"]["periods_tracked"] == 1
+
+    def test_analyze_limits_to_recent_periods(self, budget_service, user_id):
+        """Test only the most recent num_periods budgets are analyzed."""
+        for month in (1, 2, 3):
+            self._create_period(
+                budget_service, user_id, month, {"groceries": ("500", "100")}
+            )
+
+        analysis = budget_service.analyze_budgets_over_time(user_id, num_periods=2)
+
+        assert [p["name"] for p in analysis.periods] == ["Month 2", "Month 3"]
+        assert analysis.category_insights["groceries"]["periods_tracked"] == 2
+
+    def test_analyze_trend_compares_recent_to_older_periods(
+        self, budget_service, user_id
+    ):
+        """Test the last three periods are compared against earlier ones."""
+        for month, spent in (
+            (1, "900"),
+            (2, "900"),
+            (3, "100"),
+            (4, "100"),
+            (5, "100"),
+        ):
+            self._create_period(
+                budget_service, user_id, month, {"groceries": ("1000", spent)}
+            )
+
+        analysis = budget_service.analyze_budgets_over_time(user_id)
+
+        assert analysis.trend == "improving"
+        assert analysis.average_adherence == 58.0
+
+
+class TestGetActiveBudget:
+    """Tests for active budget lookup."""
+
+    def test_get_active_budget(self, budget_service, user_id, sample_budget_data):
+        """Test the budget covering today is returned."""
+        budget = budget_service.create_budget(user_id, sample_budget_data)
+
+        assert budget_service.get_active_budget(user_id).budget_id == budget.budget_id
+
+    def test_get_active_budget_reuses_lookup(
+        self, budget_service, db_session, user_id, sample_budget_data
+    ):
+        """Test repeated lookups within one service hit the database once."""
+        budget_service.create_budget(user_id, sample_budget_data)
+
+        with patch.object(
+            db_session, "execute", wraps=db_session.execute
+        ) as execute_spy:
+            first = budget_service.get_active_budget(user_id)
+            second = budget_service.get_active_budget(user_id)
+
+        assert first is second
+        assert execute_spy.call_count == 1
+
+    def test_get_active_budget_invalidated_by_create(
+        self, budget_service, user_id, sample_budget_data
+    ):
+        """Test creating a budget drops the cached active budget."""
+        budget_service.create_budget(user_id, sample_budget_data)
+        budget_service.get_active_budget(user_id)
+
+        newer = budget_service.create_budget(user_id, sample_budget_data)
+
+        assert budget_service.get_active_budget(user_id).budget_id == newer.budget_id
+
+    def test_get_active_budget_strict_loading(
+        self, budget_service, user_id, sample_budget_data
+    ):
+        """Test lazy relationship loads raise when strict loading is on."""
+        budget_service.create_budget(user_id, sample_budget_data)
+        budget_service.db.expunge_all()
+
+        with patch("core.services.budget.settings.sqla_strict_loading", True):
+            budget = budget_service.get_active_budget(user_id)
+
+        with pytest.raises(InvalidRequestError):
+            budget.budget_items
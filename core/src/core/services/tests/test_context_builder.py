@@ -0,0 +1,314 @@
+"""Tests for context builder."""
+
+import re
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from core.database.models import Base, Budget, Goal, PurchaseDecision
+from core.services import context_builder as context_builder_module
+from core.services.context_builder import ContextBuilder, _context_rows
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    """Create a test database session."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+
+    yield session
+
+    session.close()
+
+
+@pytest.fixture
+def user_id():
+    """Generate a test user ID."""
+    return uuid4()
+
+
+@pytest.fixture
+def context_cache():
+    """Start with an empty process-wide context cache."""
+    context_builder_module._context_cache.clear()
+    yield context_builder_module._context_cache
+    context_builder_module._context_cache.clear()
+
+
+@pytest.fixture
+def context_builder(db_session):
+    """Create a context builder instance."""
+    return ContextBuilder(db_session)
+
+
+def _add_budget(db_session, user_id, **overrides):
+    today = date.today()
+    values = {
+        "user_id": user_id,
+        "name": "Current Budget",
+        "total_monthly": Decimal("1000.00"),
+        "period_start": today - timedelta(days=5),
+        "period_end": today + timedelta(days=5),
+        "categories": {"groceries": {"limit": 400.0, "spent": 100.0}},
+    }
+    values.update(overrides)
+    db_session.add(Budget(**values))
+    db_session.commit()
+
+
+def _add_goal(db_session, user_id, name, **overrides):
+    values = {
+        "user_id": user_id,
+        "goal_name": name,
+        "target_amount": Decimal("1000.00"),
+        "current_amount": Decimal("250.00"),
+        "priority": "high",
+    }
+    values.update(overrides)
+    db_session.add(Goal(**values))
+    db_session.commit()
+
+
+def _add_decision(db_session, user_id, name, **overrides):
+    values = {
+        "user_id": user_id,
+        "item_name": name,
+        "amount": Decimal("59.99"),
+        "category": "electronics",
+        "score": 4,
+        "decision_category": "mild_no",
+        "reasoning": "Not needed right now.",
+        "analysis": {},
+    }
+    values.update(overrides)
+    db_session.add(PurchaseDecision(**values))
+    db_session.commit()
+
+
+class TestBuildContext:
+    """Tests for building the per-request financial context."""
+
+    def test_build_context_empty(self, context_builder, user_id):
+        """Test context for a user with no data."""
+        context = context_builder.build_context(user_id)
+
+        assert context.active_budget is None
+        assert context.active_goals == []
+        assert context.recent_decisions == []
+        assert context.has_budget is False
+        assert context.has_goals is False
+
+    def test_build_context_maps_all_sections(
+        self, context_builder, db_session, user_id
+    ):
+        """Test budget, goal and decision rows are mapped to their contexts."""
+        deadline = date.today() + timedelta(days=90)
+        _add_budget(db_session, user_id)
+        _add_goal(db_session, user_id, "Vacation", deadline=deadline)
+        _add_decision(
+            db_session, user_id, "Headphones", actual_purchase=True, regret_level=3
+        )
+
+        context = context_builder.build_context(user_id)
+
+        budget = context.active_budget
+        assert budget.name == "Current Budget"
+        assert budget.total_monthly == Decimal("1000.00")
+        assert budget.total_spent == Decimal("100.0")
+        assert budget.categories["groceries"].remaining == Decimal("300.0")
+        assert context.has_budget is True
+
+        (goal,) = context.active_goals
+        assert goal.goal_name == "Vacation"
+        assert goal.remaining == Decimal("750.00")
+        assert goal.percentage_complete == 25.0
+        assert goal.priority == "high"
+        assert goal.deadline == deadline
+        assert context.has_goals is True
+
+        (decision,) = context.recent_decisions
+        assert decision.item_name == "Headphones"
+        assert decision.amount == Decimal("59.99")
+        assert decision.category == "electronics"
+        assert decision.score == 4
+        assert decision.decision_category == "mild_no"
+        assert decision.actual_purchase is True
+        assert decision.regret_level == 3
+
+    def test_build_context_applies_filters(self, context_builder, db_session, user_id):
+        """Test expired budgets, completed goals and old decisions are skipped."""
+        today = date.today()
+        _add_budget(
+            db_session,
+            user_id,
+            name="Last Month",
+            period_start=today - timedelta(days=60),
+            period_end=today - timedelta(days=30),
+        )
+        _add_goal(db_session, user_id, "Done", is_completed=True)
+        _add_goal(db_session, user_id, "Open")
+        _add_decision(
+            db_session,
+            user_id,
+            "Old",
+            created_at=datetime.utcnow() - timedelta(days=45),
+        )
+        _add_decision(db_session, user_id, "Recent")
+        _add_goal(db_session, uuid4(), "Someone Else's")
+
+        context = context_builder.build_context(user_id)
+
+        assert context.active_budget is None
+        assert [g.goal_name for g in context.active_goals] == ["Open"]
+        assert [d.item_name for d in context.recent_decisions] == ["Recent"]
+
+    def test_build_context_orders_newest_first(
+        self, context_builder, db_session, user_id
+    ):
+        """Test goals and decisions come back newest first."""
+        now = datetime.utcnow()
+        for offset, name in enumerate(["Newest", "Middle", "Oldest"]):
+            created_at = now - timedelta(hours=offset)
+            _add_goal(db_session, user_id, name, created_at=created_at)
+            _add_decision(db_session, user_id, name, created_at=created_at)
+
+        context = context_builder.build_context(user_id)
+
+        expected = ["Newest", "Middle", "Oldest"]
+        assert [g.goal_name for g in context.active_goals] == expected
+        assert [d.item_name for d in context.recent_decisions] == expected
+
+    def test_build_context_single_round_trip(
+        self, context_builder, db_session, user_id
+    ):
+        """Test the whole context is read with one statement."""
+        _add_budget(db_session, user_id)
+        _add_goal(db_session, user_id, "Vacation")
+        _add_decision(db_session, user_id, "Headphones")
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def count(*args):
+            statements.append(args)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            context_builder.build_context(user_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert len(statements) == 1
+
+    def test_build_context_uses_shared_now(self, context_builder, db_session, user_id):
+        """Test budget and decision windows are anchored on the given time."""
+        now = datetime.utcnow() - timedelta(days=60)
+        _add_budget(
+            db_session,
+            user_id,
+            name="Two Months Ago",
+            period_start=now.date() - timedelta(days=5),
+            period_end=now.date() + timedelta(days=5),
+        )
+        _add_decision(
+            db_session, user_id, "Back Then", created_at=now - timedelta(days=1)
+        )
+        _add_decision(db_session, user_id, "Today")
+
+        context = context_builder.build_context(user_id, now=now)
+
+        assert context.active_budget.name == "Two Months Ago"
+        assert [d.item_name for d in context.recent_decisions] == [
+            "Today",
+            "Back Then",
+        ]
+
+    def test_context_rows_cast_padding_on_postgres(self):
+        """Test unused slots are typed NULLs so PostgreSQL can UNION them."""
+        sql = str(_context_rows.compile(dialect=postgresql.dialect()))
+
+        assert "CAST(NULL AS NUMERIC(10, 2)) AS amount_2" in sql
+        assert re.search(r"(?<!CAST\()NULL\b", sql) is None
+
+
+class TestGetContext:
+    """Tests for the per-user context cache."""
+
+    def test_get_context_reuses_recent_context(
+        self, context_builder, context_cache, user_id
+    ):
+        """Test a second lookup within the TTL skips the query."""
+        first = context_builder.get_context(user_id)
+
+        with patch.object(context_builder, "build_context") as build_context:
+            assert context_builder.get_context(user_id) == first
+            build_context.assert_not_called()
+
+    def test_get_context_returns_copies(self, context_builder, context_cache, user_id):
+        """Test callers can't change the context other requests get."""
+        first = context_builder.get_context(user_id)
+        first.has_goals = True
+        first.active_goals.append(None)
+
+        second = context_builder.get_context(user_id)
+        assert second is not first
+        assert second.has_goals is False
+        assert second.active_goals == []
+
+    def test_get_context_rebuilds_after_ttl(
+        self, context_builder, context_cache, user_id
+    ):
+        """Test an expired entry is rebuilt."""
+        with (
+            patch("core.services.user_cache.settings.context_cache_ttl_seconds", 0),
+            patch.object(
+                context_builder,
+                "build_context",
+                wraps=context_builder.build_context,
+            ) as build_context,
+        ):
+            context_builder.get_context(user_id)
+            context_builder.get_context(user_id)
+
+        assert build_context.call_count == 2
+
+    def test_get_context_invalidated_by_commit(
+        self, context_builder, context_cache, db_session, user_id
+    ):
+        """Test committing a change to the user's data drops the entry."""
+        other_user = uuid4()
+        assert context_builder.get_context(user_id).has_goals is False
+        context_builder.get_context(other_user)
+
+        _add_goal(db_session, user_id, "Vacation")
+
+        assert context_cache.keys() == [(str(other_user), "context")]
+        assert context_builder.get_context(user_id).has_goals is True
+
+    def test_get_context_kept_on_rollback(
+        self, context_builder, context_cache, db_session, user_id
+    ):
+        """Test a rolled back write leaves the entry in place."""
+        context_builder.get_context(user_id)
+
+        db_session.add(
+            Goal(
+                user_id=user_id,
+                goal_name="Abandoned",
+                target_amount=Decimal("100.00"),
+                priority="low",
+            )
+        )
+        db_session.flush()
+        db_session.rollback()
+
+        assert context_cache.keys() == [(str(user_id), "context")]
@@ -1,5 +1,6 @@
 """Tests for conversation swarm orchestrator."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -7,7 +8,9 @@ import pytest
 
 from core.ai.agents.conversation_swarm import SwarmOrchestrator
 from core.models.context import UserFinancialContext
-from core.models.conversation import ConversationMessage
+from core.models.conversation import ConversationMessage, ConversationRequest
+from core.services import conversation
+from core.services.conversation import ConversationService
 
 
 @pytest.fixture
@@ -22,6 +25,14 @@ def user_id():
     return uuid4()
 
 
+@pytest.fixture
+def orchestrator_cache():
+    """Start with an empty process-wide orchestrator cache."""
+    conversation._orchestrators.clear()
+    yield conversation._orchestrators
+    conversation._orchestrators.clear()
+
+
 @pytest.fixture
 def orchestrator(mock_db_session, user_id):
     """Create a swarm orchestrator."""
@@ -343,3 +354,271 @@ async def test_streaming_handoff_events(orchestrator):
     assert len(events) > 0
     # All events should have 'data' field
     assert all("data" in event for event in events)
+
+
+def test_conversation_service_evicts_least_recently_used(
+    mock_db_session, orchestrator_cache
+):
+    """Test ConversationService keeps a bounded LRU of orchestrators."""
+    service = ConversationService(mock_db_session)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    with patch("core.services.conversation.settings.max_conversation_orchestrators", 2):
+        first_orchestrator = service._get_or_create_orchestrator(first)
+        second_orchestrator = service._get_or_create_orchestrator(second)
+        # Touch the first user so the second becomes least recently used
+        assert service._get_or_create_orchestrator(first) is first_orchestrator
+        service._get_or_create_orchestrator(third)
+        service._evict_orchestrators()
+
+    assert list(orchestrator_cache) == [str(first), str(third)]
+    # The evicted orchestrator lets go of its session and agents
+    assert second_orchestrator.db is None
+    assert second_orchestrator.router_agent is None
+    assert first_orchestrator.db is mock_db_session
+
+
+def test_evicting_orchestrator_mid_turn_defers_close(
+    mock_db_session, user_id, orchestrator_cache
+):
+    """Test an orchestrator evicted during its turn is closed when the turn ends."""
+    service = ConversationService(mock_db_session)
+    seen = {}
+
+    async def fake_stream(self, user_message, conversation_history, financial_context):
+        with patch(
+            "core.services.conversation.settings.max_conversation_orchestrators", 0
+        ):
+            ConversationService(MagicMock())._evict_orchestrators()
+        seen["db"] = self.db
+        yield {"data": "hi"}
+
+    async def collect():
+        request = ConversationRequest(message="hi")
+        return [
+            chunk async for chunk in service.stream_handle_message(user_id, request)
+        ]
+
+    orchestrator = service._get_or_create_orchestrator(user_id)
+    with patch.object(SwarmOrchestrator, "stream_message", fake_stream):
+        asyncio.run(collect())
+
+    assert seen["db"] is mock_db_session
+    assert str(user_id) not in orchestrator_cache
+    assert orchestrator.db is None
+
+
+def test_conversation_service_shares_orchestrators(user_id, orchestrator_cache):
+    """Test orchestrators outlive the per-request ConversationService."""
+    first_db, second_db = MagicMock(), MagicMock()
+
+    orchestrator = ConversationService(first_db)._get_or_create_orchestrator(user_id)
+    service = ConversationService(second_db)
+
+    assert service._get_or_create_orchestrator(user_id) is orchestrator
+
+    service.reset_conversation(user_id)
+    assert str(user_id) not in orchestrator_cache
+    assert orchestrator.db is None
+
+
+def test_concurrent_turns_are_serialized(user_id, orchestrator_cache):
+    """Test a user's concurrent turns each see their own session, one at a time."""
+    first_db, second_db = MagicMock(), MagicMock()
+    seen = []
+
+    async def fake_stream(self, user_message, conversation_history, financial_context):
+        seen.append(("start", self.db))
+        await asyncio.sleep(0)
+        seen.append(("end", self.db))
+        yield {"data": user_message}
+
+    async def run(db):
+        request = ConversationRequest(message="hi")
+        service = ConversationService(db)
+        return [
+            chunk async for chunk in service.stream_handle_message(user_id, request)
+        ]
+
+    async def both():
+        return await asyncio.gather(run(first_db), run(second_db))
+
+    with patch.object(SwarmOrchestrator, "stream_message", fake_stream):
+        asyncio.run(both())
+
+    assert seen == [
+        ("start", first_db),
+        ("end", first_db),
+        ("start", second_db),
+        ("end", second_db),
+    ]
+    assert orchestrator_cache[str(user_id)].db is None
+
+
+def test_stream_handle_message_passes_context(
+    mock_db_session, user_id, orchestrator_cache
+):
+    """Test streaming uses the context built alongside the orchestrator."""
+    service = ConversationService(mock_db_session)
+    financial_context = UserFinancialContext(user_id=user_id)
+    seen = {}
+
+    async def fake_stream(self, user_message, conversation_history, financial_context):
+        seen["context"] = financial_context
+        yield {"data": "hi"}
+
+    async def collect():
+        request = ConversationRequest(message="how much is left for groceries?")
+        return [
+            chunk async for chunk in service.stream_handle_message(user_id, request)
+        ]
+
+    with (
+        patch.object(
+            service.context_builder, "build_context", return_value=financial_context
+        ),
+        patch.object(SwarmOrchestrator, "stream_message", fake_stream),
+    ):
+        chunks = asyncio.run(collect())
+
+    assert chunks == [{"data": "hi"}]
+    assert seen["context"] == financial_context
+    assert str(user_id) in orchestrator_cache
+
+
+def test_handle_message_passes_context(mock_db_session, user_id, orchestrator_cache):
+    """Test handle_message runs the swarm with the context built alongside it."""
+    service = ConversationService(mock_db_session)
+    financial_context = UserFinancialContext(user_id=user_id)
+
+    with (
+        patch.object(
+            service.context_builder, "build_context", return_value=financial_context
+        ),
+        patch.object(
+            SwarmOrchestrator, "process_message", return_value="hi there"
+        ) as process_message,
+    ):
+        response = asyncio.run(
+            service.handle_message(
+                user_id, ConversationRequest(message="how much is left for groceries?")
+            )
+        )
+
+    assert response.message == "hi there"
+    assert process_message.call_args.kwargs["financial_context"] == financial_context
+
+
+def _node_events(node_id, *texts):
+    yield {"type": "multiagent_node_start", "node_id": node_id}
+    for text in texts:
+        yield {"type": "multiagent_node_stream", "event": {"data": text}}
+
+
+def test_stream_message_streams_terminal_agents(orchestrator):
+    """Test terminal agents stream live while handoff narration is dropped."""
+    progress = []
+
+    async def fake_stream(task):
+        for event in _node_events("router", "Handing off..."):
+            yield event
+        yield {
+            "type": "multiagent_handoff",
+            "from_node_ids": ["router"],
+            "to_node_ids": ["budget_query"],
+        }
+        for event in _node_events("budget_query", "You have", " $300 left"):
+            progress.append(event["type"])
+            yield event
+        progress.append("done")
+
+    async def collect():
+        chunks = []
+        async for chunk in orchestrator.stream_message("how much is left?", []):
+            chunks.append((chunk["data"], "done" in progress))
+        return chunks
+
+    orchestrator.swarm = MagicMock()
+    orchestrator.swarm.stream_async = fake_stream
+    with patch.object(orchestrator, "_prepare_turn", return_value="task"):
+        chunks = asyncio.run(collect())
+
+    assert chunks == [("You have", False), (" $300 left", False)]
+    assert orchestrator.conversation_state["last_intent"] == "budget_query"
+
+
+def test_stream_message_buffers_agents_that_may_hand_off(orchestrator):
+    """Test non-terminal agents are only yielded once the swarm finishes."""
+
+    async def fake_stream(task):
+        for event in _node_events("purchase_decision", "Score: 4/10", ". Skip it."):
+            yield event
+
+    async def collect():
+        return [chunk async for chunk in orchestrator.stream_message("buy a tv?", [])]
+
+    orchestrator.swarm = MagicMock()
+    orchestrator.swarm.stream_async = fake_stream
+    with patch.object(orchestrator, "_prepare_turn", return_value="task"):
+        chunks = asyncio.run(collect())
+
+    assert chunks == [{"data": "Score: 4/10"}, {"data": ". Skip it."}]
+
+
+@pytest.mark.parametrize("message", ["hi", "Hello there!", "thanks so much :)", "bye."])
+def test_process_message_small_talk_skips_swarm(orchestrator, message):
+    """Test plain greetings are answered without building the swarm."""
+    small_talk_agent = MagicMock(return_value="Hey! How can I help?")
+
+    with (
+        patch.object(
+            orchestrator, "_create_small_talk_agent", return_value=small_talk_agent
+        ),
+        patch.object(orchestrator, "_create_agents_with_tools") as create_agents,
+    ):
+        response = orchestrator.process_message(message, [])
+
+    assert response == "Hey! How can I help?"
+    create_agents.assert_not_called()
+    small_talk_agent.assert_called_once_with(message)
+    assert orchestrator.conversation_state["turn_count"] == 1
+    assert orchestrator.conversation_state["last_intent"] == "small_talk"
+
+
+@pytest.mark.parametrize(
+    "message", ["ok", "hi, should I buy a $300 tv?", "thanks, log $5"]
+)
+def test_process_message_other_messages_use_swarm(orchestrator, message):
+    """Test anything beyond a bare greeting still goes through the router."""
+    with (
+        patch.object(
+            orchestrator, "_prepare_turn", return_value="task"
+        ) as prepare_turn,
+        patch.object(orchestrator, "_create_small_talk_agent") as create,
+    ):
+        orchestrator.swarm = MagicMock(return_value=None)
+        orchestrator.process_message(message, [])
+
+    prepare_turn.assert_called_once()
+    create.assert_not_called()
+
+
+def test_handle_message_small_talk_skips_context(
+    mock_db_session, user_id, orchestrator_cache
+):
+    """Test bare greetings don't fetch the financial context."""
+    service = ConversationService(mock_db_session)
+
+    with (
+        patch.object(service.context_builder, "get_context") as get_context,
+        patch.object(
+            SwarmOrchestrator, "process_message", return_value="Hi!"
+        ) as process_message,
+    ):
+        response = asyncio.run(
+            service.handle_message(user_id, ConversationRequest(message="hello"))
+        )
+
+    assert response.message == "Hi!"
+    get_context.assert_not_called()
+    assert process_message.call_args.kwargs["financial_context"] is None
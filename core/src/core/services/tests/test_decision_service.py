@@ -1,15 +1,15 @@
 """Tests for decision service."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest.mock import MagicMock, Mock, patch
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
-from core.database.models import Base
+from core.database.models import Base, Budget, BudgetItem
 from core.database.models import PurchaseDecision as PurchaseDecisionDB
 from core.models.decision import (
     BudgetAnalysis,
@@ -21,6 +21,7 @@ from core.models.decision import (
     PurchaseDecision,
     PurchaseDecisionRequest,
 )
+from core.services import decision as decision_module
 from core.services.decision import DecisionService
 
 
@@ -226,6 +227,40 @@ class TestCreateDecision:
         assert result.decision.score == 10
         assert result.decision.decision_category == DecisionScore.STRONG_YES
 
+    def test_create_decision_skips_read_back(self, db_session, user_id):
+        """Test the decision is saved without a SELECT after the commit."""
+        decision = PurchaseDecision(
+            score=4,
+            decision_category=DecisionScore.MILD_NO,
+            reasoning="Over the dining budget.",
+            analysis=DecisionAnalysis(
+                purchase_category=PurchaseCategory.DISCRETIONARY,
+                financial_health_score=60.0,
+            ),
+        )
+        request = PurchaseDecisionRequest(
+            item_name="Tasting Menu", amount=Decimal("180.00")
+        )
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with patch("core.services.decision.DecisionAgent") as agent_cls:
+            agent_cls.return_value.analyze_purchase.return_value = decision
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                result = DecisionService(db_session).create_decision(user_id, request)
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+
+        assert [s.split()[0] for s in statements] == ["INSERT"]
+        saved = db_session.get(PurchaseDecisionDB, result.decision_id)
+        assert saved.item_name == "Tasting Menu"
+        assert saved.decision_category == "mild_no"
+
 
 class TestGetDecision:
     """Tests for retrieving decisions."""
@@ -364,6 +399,72 @@ class TestListDecisions:
         assert len(user2_decisions) == 1
         assert user1_decisions[0].user_id != user2_decisions[0].user_id
 
+    def test_list_decisions_total_with_page(
+        self, decision_service, db_session, user_id
+    ):
+        """Test the total counts every match, including past the last page."""
+        now = datetime.utcnow()
+        for i in range(5):
+            db_session.add(
+                PurchaseDecisionDB(
+                    user_id=user_id,
+                    item_name=f"Item {i + 1}",
+                    amount=Decimal("100.00"),
+                    score=5,
+                    decision_category="mild_no",
+                    reasoning="Test",
+                    analysis={},
+                    created_at=now - timedelta(hours=i),
+                )
+            )
+        db_session.commit()
+
+        page = decision_service.list_decisions(user_id, limit=2, offset=2)
+        assert [d.item_name for d in page.items] == ["Item 3", "Item 4"]
+        assert page.total == 5
+
+        past_end = decision_service.list_decisions(user_id, limit=2, offset=10)
+        assert past_end.items == []
+        assert past_end.total == 5
+
+    def test_list_decisions_cursor_pages(self, decision_service, db_session, user_id):
+        """Test following next_cursor walks every decision once, in order."""
+        now = datetime.utcnow()
+        # Items 2 and 3 share a timestamp and straddle the first page break
+        for i, hours_ago in enumerate([0, 1, 1, 2, 3]):
+            db_session.add(
+                PurchaseDecisionDB(
+                    user_id=user_id,
+                    item_name=f"Item {i + 1}",
+                    amount=Decimal("100.00"),
+                    score=5,
+                    decision_category="mild_no",
+                    reasoning="Test",
+                    analysis={},
+                    created_at=now - timedelta(hours=hours_ago),
+                )
+            )
+        db_session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            page = decision_service.list_decisions(user_id, limit=2, cursor=cursor)
+            assert page.total == 5
+            seen.extend(d.id for d in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        expected = decision_service.list_decisions(user_id, limit=10)
+        assert seen == [d.id for d in expected.items]
+        assert len(set(seen)) == 5
+
+    def test_list_decisions_invalid_cursor(self, decision_service, user_id):
+        """Test a malformed cursor is rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decision_service.list_decisions(user_id, cursor="not-a-cursor")
+
 
 class TestAddFeedback:
     """Tests for adding feedback to decisions."""
@@ -480,6 +581,46 @@ class TestAddFeedback:
         assert updated.regret_level is None
         assert updated.user_feedback is None
 
+    def test_add_feedback_records_purchase_in_active_budget(
+        self, decision_service, db_session, user_id
+    ):
+        """Test a purchase lands in the user's active budget, not another's."""
+        today = datetime.utcnow().date()
+        for owner in (uuid4(), user_id):
+            db_session.add(
+                Budget(
+                    user_id=owner,
+                    name="Current Budget",
+                    total_monthly=Decimal("500.00"),
+                    period_start=today - timedelta(days=5),
+                    period_end=today + timedelta(days=5),
+                    categories={"groceries": {"limit": 500.0, "spent": 100.0}},
+                )
+            )
+        decision = PurchaseDecisionDB(
+            user_id=user_id,
+            item_name="Weekly Shop",
+            amount=Decimal("75.50"),
+            category="groceries",
+            score=8,
+            decision_category="mild_yes",
+            reasoning="Test",
+            analysis={},
+        )
+        db_session.add(decision)
+        db_session.commit()
+
+        feedback = DecisionFeedback(actual_purchase=True, regret_level=2)
+        updated = decision_service.add_feedback(user_id, decision.decision_id, feedback)
+
+        assert updated.actual_purchase is True
+        budgets = {b.user_id: b for b in db_session.query(Budget).all()}
+        assert budgets[user_id].categories["groceries"]["spent"] == 175.5
+        (item,) = db_session.query(BudgetItem).all()
+        assert item.budget_id == budgets[user_id].budget_id
+        assert item.decision_id == decision.decision_id
+        assert item.is_planned is True
+
     def test_add_feedback_update_existing(
         self, decision_service, user_id, sample_purchase_request, sample_decision
     ):
@@ -653,6 +794,184 @@ class TestGetDecisionStats:
         assert user1_stats["total_decisions"] == 2
         assert user2_stats["total_decisions"] == 3
 
+    def test_get_stats_aggregates_behavioral_scores(
+        self, decision_service, db_session, user_id
+    ):
+        """Test SQL aggregates match the behavioral score of each decision."""
+        now = datetime.utcnow()
+        rows = [
+            # (score, bought, regret, amount, days ago)
+            (3, False, None, "40.00", 2),  # intercepted -> 8.0
+            (8, False, None, "120.00", 5),  # skipped good purchase -> 4.8
+            (4, True, 9, "60.00", 40),  # regretted -> 2.0
+            (9, True, 2, "80.00", 45),  # happy with good advice -> 9.0
+            (6, None, None, "10.00", 50),  # no feedback -> 6.0
+        ]
+        for score, bought, regret, amount, days_ago in rows:
+            db_session.add(
+                PurchaseDecisionDB(
+                    user_id=user_id,
+                    item_name=f"Item {score}",
+                    amount=Decimal(amount),
+                    score=score,
+                    decision_category="neutral",
+                    reasoning="Test",
+                    analysis={},
+                    actual_purchase=bought,
+                    regret_level=regret,
+                    created_at=now - timedelta(days=days_ago),
+                )
+            )
+        db_session.commit()
+
+        stats = decision_service.get_decision_stats(user_id)
+
+        assert stats["total_decisions"] == 5
+        assert stats["average_score"] == 6.0  # (8.0+4.8+2.0+9.0+6.0)/5
+        assert stats["total_requested"] == 310.0
+        assert stats["decisions_by_category"] == {"neutral": 5}
+        assert stats["feedback_rate"] == 80.0
+        assert stats["capital_retained"] == 40.0
+        assert stats["intercepted_count"] == 1
+        # recent (8.0+4.8)/2 = 6.4 vs previous (2.0+9.0+6.0)/3
+        assert stats["impulse_control_growth"] == 12.9
+        assert [t["item_name"] for t in stats["trend_data"]] == [
+            "Item 9",
+            "Item 4",
+            "Item 8",
+            "Item 3",
+        ]
+        assert stats["weekly_scores"] == [90, 20, 48, 80]
+
+
+class TestGetDashboardSummary:
+    """Tests for the dashboard summary."""
+
+    def test_trend_reaches_past_recent_window(
+        self, decision_service, db_session, user_id
+    ):
+        """Test the trend keeps 7 points when the newest 20 have no feedback."""
+        now = datetime.utcnow()
+        for i in range(30):
+            db_session.add(
+                PurchaseDecisionDB(
+                    user_id=user_id,
+                    item_name=f"Item {i}",
+                    amount=Decimal("10.00"),
+                    category="groceries",
+                    score=6,
+                    decision_category="neutral",
+                    reasoning="Test",
+                    analysis={},
+                    # Only the 10 oldest have feedback
+                    actual_purchase=False if i >= 20 else None,
+                    created_at=now - timedelta(hours=i),
+                )
+            )
+        db_session.commit()
+
+        summary = decision_service.get_dashboard_summary(user_id)
+
+        assert [t["item_name"] for t in summary["score_trend"]] == [
+            f"Item {i}" for i in range(26, 19, -1)
+        ]
+        assert [d["item_name"] for d in summary["recent_decisions"]] == [
+            f"Item {i}" for i in range(5)
+        ]
+        assert summary["recent_decisions"][0]["amount"] == 10.0
+
+
+@pytest.fixture
+def stats_cache():
+    """Start with an empty process-wide stats cache."""
+    decision_module._stats_cache.clear()
+    yield decision_module._stats_cache
+    decision_module._stats_cache.clear()
+
+
+def _add_decision_row(db_session, user_id, **overrides):
+    values = {
+        "user_id": user_id,
+        "item_name": "Headphones",
+        "amount": Decimal("59.99"),
+        "score": 4,
+        "decision_category": "mild_no",
+        "reasoning": "Test",
+        "analysis": {},
+    }
+    values.update(overrides)
+    db_session.add(PurchaseDecisionDB(**values))
+    db_session.commit()
+
+
+class TestStatsCache:
+    """Tests for the per-user stats and dashboard cache."""
+
+    def test_stats_reused_within_ttl(self, decision_service, stats_cache, user_id):
+        """Test a second lookup within the TTL skips the queries."""
+        first = decision_service.get_decision_stats_json(user_id)
+
+        with patch.object(decision_service, "_build_decision_stats") as build:
+            assert decision_service.get_decision_stats_json(user_id) is first
+            assert decision_service.get_decision_stats(user_id)["total_decisions"] == 0
+            build.assert_not_called()
+
+    def test_stats_rebuilt_after_ttl(self, decision_service, stats_cache, user_id):
+        """Test an expired entry is rebuilt."""
+        with (
+            patch("core.services.decision.settings.stats_cache_ttl_seconds", 0),
+            patch.object(
+                decision_service,
+                "_build_decision_stats",
+                wraps=decision_service._build_decision_stats,
+            ) as build,
+        ):
+            decision_service.get_decision_stats(user_id)
+            decision_service.get_decision_stats(user_id)
+
+        assert build.call_count == 2
+
+    def test_cached_stats_not_shared(self, decision_service, stats_cache, user_id):
+        """Test callers can't change what later lookups see."""
+        decision_service.get_decision_stats(user_id)["total_decisions"] = 99
+        decision_service.get_dashboard_summary(user_id)["score_trend"].append(1)
+
+        assert decision_service.get_decision_stats(user_id)["total_decisions"] == 0
+        assert decision_service.get_dashboard_summary(user_id)["score_trend"] == []
+
+    def test_commit_invalidates_user_entries(
+        self, decision_service, stats_cache, db_session, user_id
+    ):
+        """Test committing a decision drops only that user's entries."""
+        other_user = uuid4()
+        assert decision_service.get_decision_stats(user_id)["total_decisions"] == 0
+        decision_service.get_dashboard_summary(user_id)
+        decision_service.get_decision_stats(other_user)
+
+        _add_decision_row(db_session, user_id)
+
+        assert stats_cache.keys() == [(str(other_user), "stats")]
+        assert decision_service.get_decision_stats(user_id)["total_decisions"] == 1
+
+    def test_commit_during_build_not_cached(
+        self, decision_service, stats_cache, db_session, user_id
+    ):
+        """Test a result read before a concurrent commit isn't kept."""
+        build_stats = decision_service._build_decision_stats
+
+        def build_then_commit(build_user_id):
+            stats = build_stats(build_user_id)
+            _add_decision_row(db_session, user_id)
+            return stats
+
+        with patch.object(
+            decision_service, "_build_decision_stats", side_effect=build_then_commit
+        ):
+            assert decision_service.get_decision_stats(user_id)["total_decisions"] == 0
+
+        assert stats_cache.keys() == []
+        assert decision_service.get_decision_stats(user_id)["total_decisions"] == 1
+
 
 class TestDecisionServiceIntegration:
     """Integration tests for decision service."""
@@ -0,0 +1,113 @@
+"""Per-process caches of values derived from a user's rows.
+
+Each cache keeps recent values per (user, kind) in LRU order until a TTL
+runs out, and drops a user's entries once a session commits a flush that
+touched one of the cache's models for that user.
+
+Invalidation is local to this process and only sees ORM flushes. Core
+update()/delete() statements, bulk writes and writes made by other workers
+leave entries stale until their TTL runs out.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from core.config import settings
+
+_caches: List["UserCache"] = []
+
+
+class UserCache:
+    """LRU cache of per-user values that expire after a TTL.
+
+    Cached values are handed to every caller, so only store immutable ones
+    (encoded bytes, or models the caller copies before returning).
+    """
+
+    def __init__(self, models: tuple, ttl_setting: str, size_setting: str):
+        """Create a cache and register it for write invalidation.
+
+        Args:
+            models: ORM models with a user_id whose writes invalidate entries
+            ttl_setting: Name of the setting with the entry TTL in seconds
+            size_setting: Name of the setting with the maximum entry count
+        """
+        self.models = models
+        self._ttl_setting = ttl_setting
+        self._size_setting = size_setting
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._kinds: set[str] = set()
+        # Bumped on every invalidation so a value built from rows read before
+        # a commit isn't stored after that commit dropped the old entry
+        self._generation = 0
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def get(self, user_id: UUID, kind: str, build: Callable[[], Any]) -> Any:
+        """Return a recent value for (user, kind), calling build() on a miss."""
+        key = (str(user_id), kind)
+        with self._lock:
+            entry = self._entries.get(key)
+            ttl = getattr(settings, self._ttl_setting)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+            generation = self._generation
+
+        built_at = time.monotonic()
+        value = build()
+        with self._lock:
+            if generation == self._generation:
+                self._kinds.add(kind)
+                self._entries[key] = (built_at, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > getattr(settings, self._size_setting):
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop every cached value for a user."""
+        user_key = str(user_id)
+        with self._lock:
+            self._generation += 1
+            for kind in self._kinds:
+                self._entries.pop((user_key, kind), None)
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """Cached (user, kind) keys, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_writes(session: Session, flush_context) -> None:
+    touched = session.info.setdefault("user_cache_writes", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        for cache in _caches:
+            if isinstance(obj, cache.models):
+                touched.add((cache, str(obj.user_id)))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_writes(session: Session) -> None:
+    for cache, user_id in session.info.pop("user_cache_writes", ()):
+        cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_writes(session: Session, previous_transaction) -> None:
+    session.info.pop("user_cache_writes", None)